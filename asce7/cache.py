@@ -0,0 +1,156 @@
+"""Size bounded caches, and opt-in memoization of repeated scalar figure lookups.
+
+>>> from asce7.cache import enable_scalar_cache, scalar_cache_stats
+>>> enable_scalar_cache(maxsize=1024, tolerance=1e-6)
+
+Scalar calls of the decorated lookups (e.g. `fig7p4d1_Cs`, `eq29p4d6_GCrn_nom`) are then memoized, with float
+arguments quantized to the tolerance; calls with array arguments always bypass the cache.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from numbers import Real
+from typing import NamedTuple
+import threading
+import numpy as np
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache:
+    """Least recently used cache holding at most `maxsize` entries. Thread safe."""
+
+    def __init__(self, maxsize=256):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """The value for `key` (counted as a hit) or `default` (counted as a miss)."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+
+_MISSING = object()
+_SCALAR_CACHES = {}
+_scalar_cache_settings = dict(enabled=False, maxsize=256, tolerance=1e-9)
+
+
+def _normalize(value, tolerance):
+    if isinstance(value, np.ndarray):
+        value = value.item()
+    if isinstance(value, (Real, np.number)) and not isinstance(value, (bool, np.bool_)):
+        return round(float(value) / tolerance)
+    return value
+
+
+def _copy(value):
+    """value, with any arrays in it copied, so that callers cannot change a cached result in place."""
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return type(value)(*map(_copy, value)) if hasattr(value, "_fields") else tuple(map(_copy, value))
+    return value
+
+
+def scalar_cache(func):
+    """Decorator: memoize calls of `func` with scalar arguments while the scalar cache is enabled.
+
+    See `enable_scalar_cache`. Calls with any array argument go straight to `func`. Array results are copied into
+    and out of the cache.
+    """
+
+    cache = LRUCache(_scalar_cache_settings["maxsize"])
+    settings = _scalar_cache_settings
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not settings["enabled"] or any(np.ndim(v) > 0 for v in (*args, *kwargs.values())):
+            return func(*args, **kwargs)
+        tolerance = settings["tolerance"]
+        key = (tuple(_normalize(v, tolerance) for v in args),
+               tuple(sorted((k, _normalize(v, tolerance)) for k, v in kwargs.items())))
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            cache.put(key, _copy(result))
+            return result
+        return _copy(result)
+
+    wrapper.cache = cache
+    _SCALAR_CACHES[f"{func.__module__}.{func.__qualname__}"] = cache
+    return wrapper
+
+
+def enable_scalar_cache(maxsize=256, tolerance=1e-9):
+    """Turn on memoization of scalar lookups.
+
+    maxsize: maximum number of entries kept for each function
+    tolerance: float arguments closer than this share a cache entry
+    """
+    if tolerance != _scalar_cache_settings["tolerance"]:
+        clear_scalar_cache()
+    _scalar_cache_settings.update(enabled=True, maxsize=maxsize, tolerance=tolerance)
+    for cache in _SCALAR_CACHES.values():
+        cache.resize(maxsize)
+
+
+def disable_scalar_cache():
+    """Turn off memoization of scalar lookups and empty the caches."""
+    _scalar_cache_settings["enabled"] = False
+    clear_scalar_cache()
+
+
+def clear_scalar_cache():
+    """Empty the scalar lookup caches and reset their statistics."""
+    for cache in _SCALAR_CACHES.values():
+        cache.clear()
+
+
+def scalar_cache_stats():
+    """`CacheStats` of each memoized function, by qualified name."""
+    return {name: cache.stats() for name, cache in _SCALAR_CACHES.items()}
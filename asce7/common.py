@@ -1,5 +1,7 @@
-from functools import partial
+from functools import partial, wraps
 from math import pi, atan
+import inspect
+import threading
 import numpy as np
 
 
@@ -35,6 +37,52 @@ class Deg(float):
         return f'{type(self).__name__}({self.value:{format_spec}})'
 
 
+class _AngleArray(np.ndarray):
+    """Array of angles in radians that remembers the values it was made from.
+
+    Arrays derived from it (slices, views) fall back on converting the radians back for display, and the results of
+    numpy functions on it are plain arrays. Subclasses give the conversions of their units as class arguments:
+
+    class DegArray(_AngleArray, to_radians=..., from_radians=...)
+    """
+
+    def __init_subclass__(cls, *, to_radians, from_radians, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._to_radians, cls._from_radians = staticmethod(to_radians), staticmethod(from_radians)
+
+    def __new__(cls, value):
+        if cls is _AngleArray:
+            raise TypeError("_AngleArray has no units; use a subclass such as DegArray or SlopeIn12Array")
+        value = np.asarray(value, dtype=float)
+        obj = np.asarray(cls._to_radians(value)).view(cls)
+        obj.value = value
+        return obj
+
+    @property
+    def units(self):
+        """The angles in the units of the type."""
+        return self.value if self.value is not None else self._from_radians(self.view(np.ndarray))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({np.array2string(self.units, separator=", ")})'
+
+    def __array_finalize__(self, obj):
+        self.value = None
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        result = obj.view(np.ndarray)
+        return result[()] if return_scalar else result
+
+
+class SlopeIn12Array(_AngleArray, to_radians=lambda value: np.arctan(value/12),
+                     from_radians=lambda radians: 12*np.tan(radians)):
+    """Vectorized `SlopeIn12`: an array of angles given as change in height over 12 inches. Height is in inches."""
+
+
+class DegArray(_AngleArray, to_radians=lambda value: value * pi/180, from_radians=lambda radians: radians * 180/pi):
+    """Vectorized `Deg`: an array of angles in degrees."""
+
+
 class Log(np.ndarray):
     """Representation for the log10 of a number."""
 
@@ -55,6 +103,109 @@ class Log(np.ndarray):
         self.value = getattr(obj, 'value', None)
 
 
+def label_codes(values, labels):
+    """Integer codes (positions in `labels`) for a label, enum member or integer code, or an array or sequence of
+    them, which may be mixed.
+
+    String arrays are matched against the sorted labels; other input is looked up value by value in a dict.
+    """
+
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        codes = values.astype(np.intp)
+    elif isinstance(values, np.ndarray) and values.dtype.kind in "US":
+        codes = _string_codes(values, labels)
+    else:
+        lookup = {label: code for code, label in enumerate(labels)}
+        lookup.update((code, code) for code in range(len(labels)))
+        if isinstance(values, (list, tuple)):
+            try:
+                return _dict_codes(values, lookup, len(labels))
+            except TypeError:
+                # nested sequences
+                pass
+        arr = np.asarray(values, dtype=object)
+        codes = _dict_codes(arr.ravel().tolist(), lookup, len(labels)).reshape(arr.shape)
+    if np.any((codes < 0) | (codes >= len(labels))):
+        raise IndexError(f"code out of range for {len(labels)} labels")
+    return codes
+
+
+def _dict_codes(values, lookup, count):
+    try:
+        return np.fromiter(map(lookup.__getitem__, values), np.intp, len(values))
+    except KeyError as e:
+        if isinstance(e.args[0], (int, np.integer)):
+            raise IndexError(f"code {e.args[0]} out of range for {count} labels") from None
+        raise
+
+
+def _string_codes(values, labels):
+    label_arr = np.array([getattr(label, "value", label) for label in labels])
+    order = np.argsort(label_arr)
+    sorted_labels = label_arr[order]
+    positions = np.minimum(np.searchsorted(sorted_labels, values), len(labels) - 1)
+    unknown = sorted_labels[positions] != values
+    if np.any(unknown):
+        raise KeyError(values[unknown].flat[0].item())
+    return order[positions].astype(np.intp)
+
+
+def interp_weights(x, xp):
+    """Lower indices and weights for linear interpolation of `x` along the increasing axis `xp`.
+
+    x is clipped to the ends of the axis. The interpolated value of fp is (1 - w)*fp[i] + w*fp[i + 1].
+    """
+
+    xp = np.asarray(xp, dtype=float)
+    x = np.clip(np.asarray(x, dtype=float), xp[0], xp[-1])
+    i = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    w = (x - xp[i]) / (xp[i + 1] - xp[i])
+    return i, w
+
+
+def build_once(builder):
+    """Decorator for a builder taking no arguments: build on the first call and return the cached value after that.
+
+    Thread safe; the builder runs at most once.
+    """
+
+    lock = threading.Lock()
+    cache = []
+
+    @wraps(builder)
+    def accessor():
+        if not cache:
+            with lock:
+                if not cache:
+                    cache.append(builder())
+        return cache[0]
+
+    return accessor
+
+
+def lazy_attributes(module_name, accessors):
+    """The `warmup` and module `__getattr__` functions of a module with attributes built on first access.
+
+    accessors: mapping of attribute name to a function without arguments returning its value (e.g. `build_once`)
+
+    warmup, __getattr__ = lazy_attributes(__name__, dict(FIG7P4D1_Cs_DICT=fig7p4d1_Cs_dict))
+    """
+
+    def warmup():
+        """Build all of the module's lazy attributes (e.g. interpolants) now rather than on first use."""
+        for accessor in accessors.values():
+            accessor()
+
+    def __getattr__(name):
+        try:
+            return accessors[name]()
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+
+    warmup.__module__ = __getattr__.__module__ = module_name
+    return warmup, __getattr__
+
+
 def attach_filter(filter_func, func=None):
     """Add a `filter` attribute to the function so it can be used elsewhere."""
 
@@ -65,3 +216,35 @@ def attach_filter(filter_func, func=None):
     filter_seq.append(filter_func)
     func.filter = filter_seq
     return func
+
+
+def _parameters(func):
+    return inspect.signature(func).parameters
+
+
+def _arguments(func, inputs):
+    try:
+        return {name: inputs[name] for name in _parameters(func)}
+    except KeyError as e:
+        raise TypeError(f"missing input {e.args[0]!r} for {func.__name__}") from None
+
+
+def evaluate_filtered(func, **inputs):
+    """Evaluate `func` only where all of its filters (see `attach_filter`) apply.
+
+    inputs: arguments of func and of its filters by name; arrays (including arrays of strings) broadcast together
+
+    Returns the results, nan where the filters do not apply, and the boolean mask of where they apply.
+    """
+
+    shape = np.broadcast_shapes(*(np.shape(value) for value in inputs.values() if np.ndim(value) > 0))
+    mask = np.ones(shape, dtype=bool)
+    for filter_func in getattr(func, "filter", []):
+        mask &= filter_func(**_arguments(filter_func, inputs))
+
+    kwargs = {name: np.broadcast_to(value, shape)[mask] if np.ndim(value) > 0 else value
+              for name, value in _arguments(func, inputs).items()}
+    result = np.full(shape, np.nan)
+    if mask.any():
+        result[mask] = func(**kwargs)
+    return result, mask
@@ -0,0 +1,89 @@
+"""Evaluation of chains of equations, linked by the names of their outputs and parameters.
+
+The output of an equation function is named by the part of the function name after its section prefix, e.g.
+eq7p4d1_ps computes ps and fig7p4d1_Cs computes Cs. Parameters are matched to inputs or to other outputs by name.
+
+>>> from asce7.v2016 import chapter29 as ch29
+>>> graph = Graph([ch29.eq29p4d5_p, ch29.eq29p4d6_GCrn, ch29.eq29p4d6_γp, ch29.eq29p4d6_γc, ch29.eq29p4d6_γE,
+...                ch29.eq29p4d6_GCrn_nom])
+>>> graph.order("p", ["qh", "hpt", "h", "Lp", "exposure_condition", "zone", "tilt", "area"])
+('γp', 'γc', 'γE', 'GCrn_nom', 'GCrn', 'p')
+"""
+
+import inspect
+import re
+from asce7.exceptions import ASCE7Error
+
+_OUTPUT_NAME_RE = re.compile(r"^(?:eq|fig|table)[0-9p]+(?:d[0-9]+[A-Z]?)?_(?P<name>.+)$")
+
+
+def output_name(func):
+    """Name of the value computed by an equation function, e.g. "ps" for eq7p4d1_ps."""
+    match = _OUTPUT_NAME_RE.match(func.__name__)
+    if match is None:
+        raise ASCE7Error(f"cannot tell the output name of {func.__name__}")
+    return match["name"]
+
+
+class Graph:
+    """Dependency graph of equation functions.
+
+    functions: equation functions (outputs named by `output_name`), or a mapping of output name to function
+    """
+
+    def __init__(self, functions):
+        if hasattr(functions, "items"):
+            providers = dict(functions)
+        else:
+            providers = {}
+            for func in functions:
+                name = output_name(func)
+                if name in providers:
+                    raise ASCE7Error(f"{name!r} is computed by both {providers[name].__name__} and {func.__name__}; "
+                                     f"pass a mapping of output name to function to choose")
+                providers[name] = func
+        self.providers = providers
+        self._parameters = {name: inspect.signature(func).parameters for name, func in providers.items()}
+
+    def order(self, outputs, inputs):
+        """The names computed to get `outputs` (a name or names) from the named `inputs`, in evaluation order."""
+
+        outputs = (outputs,) if isinstance(outputs, str) else tuple(outputs)
+        inputs = set(inputs)
+        order, visiting, done = [], set(), set()
+
+        def visit(name, needed_by):
+            if name in inputs or name in done:
+                return True
+            if name not in self.providers:
+                if needed_by is None:
+                    raise ASCE7Error(f"no input or equation for {name!r}")
+                return False
+            if name in visiting:
+                raise ASCE7Error(f"circular dependency on {name!r}")
+            visiting.add(name)
+            for parameter in self._parameters[name].values():
+                if not visit(parameter.name, name) and parameter.default is parameter.empty:
+                    raise ASCE7Error(f"cannot compute {name!r}: no input or equation for {parameter.name!r}")
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+            return True
+
+        for output in outputs:
+            visit(output, None)
+        return tuple(order)
+
+    def evaluate(self, outputs, **inputs):
+        """Compute `outputs` from the inputs, each intermediate value exactly once.
+
+        Returns the value for a single output name, or a dict of values for a sequence of names.
+        """
+
+        values = dict(inputs)
+        for name in self.order(outputs, inputs):
+            values[name] = self.providers[name](**{parameter: values[parameter]
+                                                    for parameter in self._parameters[name] if parameter in values})
+        if isinstance(outputs, str):
+            return values[outputs]
+        return {output: values[output] for output in outputs}
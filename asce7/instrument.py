@@ -0,0 +1,250 @@
+"""Opt-in instrumentation of the code section functions: call counts, array sizes, wall time and allocated memory.
+
+>>> from asce7.instrument import Profiler
+>>> with Profiler() as profiler:
+...     run_the_job()
+>>> print(profiler.format_report())
+
+While enabled, the public functions of the chapter modules (and the methods of their classes, e.g. the `Strength` and
+`ASD` load combinations) are replaced by recording wrappers; disabling puts the original functions back, so nothing
+is added to the calls of a run that is not profiled. References taken before enabling (`from ... import` in user
+code, `functools.partial`, a `Graph`) keep calling the originals and are not recorded.
+
+Setting the environment variable ASCE7_PROFILE enables a profiler when asce7.v2016 is imported: ASCE7_PROFILE=1
+prints the report to stderr at exit, any other value is a path the report is written to as JSON. Set
+ASCE7_PROFILE_MEMORY=0 to skip the (slow) memory tracing.
+
+Memory is measured only for calls made in the thread that enabled the profiler, since tracemalloc's peak is shared by
+the whole process; calls from other threads (e.g. `ChunkedExecutor` chunks) are recorded without allocated bytes, and
+allocations of other threads running at the same time are counted in the calls of the profiling thread.
+"""
+
+from collections.abc import Mapping
+from functools import wraps
+from typing import NamedTuple
+import inspect
+import os
+import threading
+import time
+import tracemalloc
+import numpy as np
+
+
+class CallEvent(NamedTuple):
+    """One recorded call, as passed to a profiler callback.
+
+    elements: size of the largest array argument (1 for scalar calls)
+    seconds: wall time of the call, including the instrumented functions it calls
+    allocated: peak memory allocated during the call, in bytes (None when memory is not traced, or the call is made
+        in a thread other than the one that enabled the profiler)
+    """
+    name: str
+    elements: int
+    seconds: float
+    allocated: int
+
+
+class FunctionStats(NamedTuple):
+    calls: int
+    elements: int
+    max_elements: int
+    seconds: float
+    allocated: int
+    max_allocated: int
+
+
+def _elements(value):
+    if isinstance(value, Mapping):
+        return max((_elements(v) for v in value.values()), default=1)
+    return np.size(value)
+
+
+def _chapter_modules():
+    from asce7 import v2016
+    from asce7.v2016 import chapter1
+    modules = [v2016, chapter1]
+    for submodule in sorted(v2016._SUBMODULES):
+        modules.append(getattr(v2016, submodule))
+    return modules
+
+
+def _is_function(value):
+    return inspect.isfunction(inspect.unwrap(value))
+
+
+class Profiler:
+    """Records calls of the public functions and methods of modules while enabled; use as a context manager or with
+    `enable` and `disable`.
+
+    modules: modules to instrument, by default asce7.v2016 and all its chapters
+    memory: trace allocated memory (tracemalloc) of the calls made in the enabling thread, which slows them down
+        considerably
+    callback: called with a `CallEvent` after each recorded call
+    """
+
+    def __init__(self, modules=None, memory=True, callback=None):
+        self.modules = modules
+        self.memory = memory
+        self.callback = callback
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._memory_thread = None
+        self._memory_stack = []
+        self._patches = []
+        self._started_tracemalloc = False
+
+    @property
+    def enabled(self):
+        return bool(self._patches)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        modules = _chapter_modules() if self.modules is None else list(self.modules)
+
+        wrappers = {}
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if name.startswith("_"):
+                    continue
+                if _is_function(value) and value.__module__ == module.__name__:
+                    wrappers[id(value)] = self._wrap(value, f"{module.__name__}.{name}")
+                elif isinstance(value, type) and value.__module__ == module.__name__:
+                    self._patch_class(value)
+        # rebind every module level name of the functions, e.g. chapter7's import of importance_factor
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if id(value) in wrappers:
+                    self._patch(module, name, value, wrappers[id(value)])
+
+        self._memory_thread = threading.get_ident()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self):
+        while self._patches:
+            namespace, name, original, wrapper = self._patches.pop()
+            if vars(namespace).get(name) is wrapper:
+                setattr(namespace, name, original)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _patch(self, namespace, name, original, wrapper):
+        setattr(namespace, name, wrapper)
+        self._patches.append((namespace, name, original, wrapper))
+
+    def _patch_class(self, cls):
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or not _is_function(value):
+                continue
+
+            def method(self, *args, _original=value, **kwargs):
+                return _original.__get__(self, type(self))(*args, **kwargs)
+
+            wraps(value)(method)
+            self._patch(cls, name, value, self._wrap(method, f"{cls.__module__}.{cls.__qualname__}.{name}"))
+
+    def _wrap(self, func, name):
+        profiler = self
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            memory = profiler.memory and threading.get_ident() == profiler._memory_thread and tracemalloc.is_tracing()
+            if memory:
+                frame = profiler._enter_memory()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                allocated = profiler._exit_memory(frame) if memory else None
+                elements = max((_elements(v) for v in (*args, *kwargs.values())), default=1)
+                profiler._record(CallEvent(name, elements, seconds, allocated))
+
+        return wrapper
+
+    # peaks of nested calls: each call resets the tracemalloc peak, so the enclosing calls keep the peak seen so far
+    def _enter_memory(self):
+        stack = self._memory_stack
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        stack.append(frame)
+        return frame
+
+    def _exit_memory(self, frame):
+        stack = self._memory_stack
+        _, peak = tracemalloc.get_traced_memory()
+        stack.pop()
+        peak = max(frame[1], peak)
+        if stack:
+            stack[-1][1] = max(stack[-1][1], peak)
+        return peak - frame[0]
+
+    def _record(self, event):
+        with self._lock:
+            stats = self._stats.get(event.name)
+            allocated = event.allocated or 0
+            if stats is None:
+                stats = FunctionStats(1, event.elements, event.elements, event.seconds, allocated, allocated)
+            else:
+                stats = FunctionStats(stats.calls + 1, stats.elements + event.elements,
+                                      max(stats.max_elements, event.elements), stats.seconds + event.seconds,
+                                      stats.allocated + allocated, max(stats.max_allocated, allocated))
+            self._stats[event.name] = stats
+        if self.callback is not None:
+            self.callback(event)
+
+    def reset(self):
+        """Forget the recorded calls."""
+        with self._lock:
+            self._stats.clear()
+
+    def report(self):
+        """`FunctionStats` of each called function, by qualified name, most time first."""
+        with self._lock:
+            return dict(sorted(self._stats.items(), key=lambda item: item[1].seconds, reverse=True))
+
+    def format_report(self):
+        """The report as a text table."""
+        lines = [f"{'function':<60}{'calls':>10}{'elements':>14}{'seconds':>12}{'allocated':>16}"]
+        for name, stats in self.report().items():
+            lines.append(f"{name:<60}{stats.calls:>10}{stats.elements:>14}{stats.seconds:>12.6f}"
+                         f"{stats.allocated:>16,d}")
+        return "\n".join(lines)
+
+
+def enable_from_environment():
+    """Enable a `Profiler` as set by the ASCE7_PROFILE environment variables (see the module docstring), reporting at
+    exit. Returns the profiler, or None when ASCE7_PROFILE is not set."""
+
+    destination = os.environ.get("ASCE7_PROFILE")
+    if not destination:
+        return None
+    import atexit
+    profiler = Profiler(memory=os.environ.get("ASCE7_PROFILE_MEMORY", "1") != "0")
+    profiler.enable()
+
+    def report():
+        if destination == "1":
+            import sys
+            print(profiler.format_report(), file=sys.stderr)
+        else:
+            import json
+            with open(destination, "w", encoding="utf-8") as f:
+                json.dump({name: stats._asdict() for name, stats in profiler.report().items()}, f, indent=2,
+                          ensure_ascii=False)
+
+    atexit.register(report)
+    return profiler
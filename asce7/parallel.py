@@ -0,0 +1,281 @@
+"""Parallel evaluation of the chapter equations and pipelines: many buildings on a process pool (`run_portfolio`),
+and very large arrays in chunks on a thread pool (`ChunkedExecutor`).
+
+>>> from asce7.parallel import run_portfolio
+>>> loads = run_portfolio("snow", buildings, workers=8)
+
+The input columns are put in shared memory once; each worker imports the chapter module and builds its interpolants
+once (in the pool initializer), evaluates shards of rows read straight from the shared columns and writes the results
+into shared output columns. Only the row ranges of the shards are sent to the workers.
+
+Shards and chunks start at multiples of `SHARD_ALIGNMENT` elements so that the numpy loops split the elements into the
+same vector blocks as a single call with all the elements, and the results equal those of a single call exactly.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce, wraps
+from importlib import import_module
+from multiprocessing import shared_memory
+from typing import NamedTuple
+import math
+import os
+import threading
+import numpy as np
+from asce7.common import label_codes
+
+SHARD_ALIGNMENT = 1024
+
+
+class _Pipeline(NamedTuple):
+    module: str
+    function: str
+    outputs: tuple
+    columns: tuple
+    labels: dict
+
+
+def _snow(module, columns):
+    return tuple(module.snow_loads(columns))
+
+
+def _wind(module, columns):
+    return module.velocity_pressure(**columns),
+
+
+_PIPELINES = dict(
+    snow=_Pipeline("asce7.v2016.chapter7", "_snow", ("pf", "pm", "Cs", "ps", "R", "governing"),
+                   ("risk", "pg", "wind_surface_roughness", "snow_exposure", "thermal_condition", "surface_type",
+                    "roof_slope", "W", "roof_type"),
+                   dict(risk="asce7.v2016.chapter1:Risk",
+                        wind_surface_roughness="asce7.v2016.chapter7:TABLE7P3D1_Ce_NS.wind_surface_roughness",
+                        snow_exposure="asce7.v2016.chapter7:TABLE7P3D1_Ce_NS.snow_exposure",
+                        thermal_condition="asce7.v2016.chapter7:TABLE7P3D2_Ct_NS.thermal_condition",
+                        surface_type="asce7.v2016.chapter7:_FIG7P4D1_Cs_SURFACE_TYPES")),
+    wind=_Pipeline("asce7.v2016.chapter26", "_wind", ("qz",), ("z", "exposure", "V", "Kd", "Kzt", "ground_elevation"),
+                   dict(exposure="asce7.v2016.chapter26:TABLE26P11D1_NS.exposure")),
+)
+PIPELINES = tuple(_PIPELINES)
+
+
+def _evaluate(pipeline, columns):
+    pipeline = _PIPELINES[pipeline]
+    return globals()[pipeline.function](import_module(pipeline.module), columns)
+
+
+def _result(pipeline, outputs):
+    if pipeline == "snow":
+        from asce7.v2016.chapter7 import SnowLoads
+        return SnowLoads(*outputs)
+    return outputs[0]
+
+
+def _labels(location):
+    module, path = location.split(":")
+    return reduce(getattr, path.split("."), import_module(module))
+
+
+def _prepare_columns(pipeline, columns):
+    """Columns as a dict of arrays, label columns encoded as integer codes, and the number of rows."""
+    if isinstance(columns, np.ndarray):
+        columns = {name: columns[name] for name in columns.dtype.names}
+    known = _PIPELINES[pipeline].columns
+    unknown = set(columns) - set(known)
+    if unknown:
+        raise TypeError(f"unknown {pipeline} columns: {', '.join(sorted(unknown))}")
+    arrays = {}
+    labels = _PIPELINES[pipeline].labels
+    for name, column in columns.items():
+        if name in labels:
+            array = label_codes(column, _labels(labels[name]))
+        else:
+            array = np.asarray(column)
+            if array.dtype == object:
+                array = array.astype(str)
+        if array.ndim > 1:
+            raise ValueError(f"column {name!r} has {array.ndim} dimensions, expected 1")
+        arrays[name] = array
+    rows = np.broadcast_shapes(*(array.shape for array in arrays.values()))
+    return arrays, (rows[0] if rows else 1)
+
+
+# the worker's shared columns, attached once by the pool initializer
+_worker = {}
+
+
+def _attach(spec):
+    shm = shared_memory.SharedMemory(name=spec[0])
+    return shm, np.ndarray(spec[2], dtype=spec[1], buffer=shm.buf)
+
+
+def _init_worker(pipeline, column_specs, scalars, output_specs):
+    module = import_module(_PIPELINES[pipeline].module)
+    if hasattr(module, "warmup"):
+        module.warmup()
+    shms, columns, outputs = [], dict(scalars), []
+    for name, spec in column_specs.items():
+        shm, columns[name] = _attach(spec)
+        shms.append(shm)
+    for spec in output_specs:
+        shm, output = _attach(spec)
+        shms.append(shm)
+        outputs.append(output)
+    _worker.update(pipeline=pipeline, shms=shms, columns=columns, outputs=outputs)
+
+
+def _run_shard(start, stop):
+    columns = {name: column[start:stop] if column.ndim else column for name, column in _worker["columns"].items()}
+    for output, result in zip(_worker["outputs"], _evaluate(_worker["pipeline"], columns)):
+        output[start:stop] = result
+
+
+def _shards(rows, workers, shard_rows):
+    if shard_rows is None:
+        # a few shards per worker, to even out the load
+        shard_rows = -(-rows // (4 * workers))
+    shard_rows = max(SHARD_ALIGNMENT, -(-shard_rows // SHARD_ALIGNMENT) * SHARD_ALIGNMENT)
+    return [(start, min(start + shard_rows, rows)) for start in range(0, rows, shard_rows)]
+
+
+def _share(shape, dtype, shms, values=None):
+    """Spec (name, dtype, shape) of a new shared memory array, filled with values if given."""
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    shms.append(shm)
+    if values is not None:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = values
+    return shm.name, dtype.str, shape
+
+
+def _copy_shared(shm, spec):
+    return np.ndarray(spec[2], dtype=spec[1], buffer=shm.buf).copy()
+
+
+def run_portfolio(pipeline, columns, workers=None, shard_rows=None, mp_context=None):
+    """Evaluate a pipeline for a table of buildings, with the rows sharded across a process pool.
+
+    pipeline: "snow" (chapter 7 `snow_loads`, returns `SnowLoads`) or "wind" (chapter 26 `velocity_pressure`,
+        returns qz)
+    columns: mapping of column name to 1d array or scalar, or structured array; the columns of `snow_loads`, or the
+        arguments of `velocity_pressure`. Label columns (labels, enum members or codes) are shared as integer codes.
+    workers: number of processes, by default os.cpu_count(); with one worker the pipeline runs in this process
+    shard_rows: rows per task, rounded up to a multiple of SHARD_ALIGNMENT
+    mp_context: multiprocessing context of the pool
+    """
+
+    if pipeline not in _PIPELINES:
+        raise ValueError(f"unknown pipeline {pipeline!r}, expected one of {', '.join(PIPELINES)}")
+    columns, rows = _prepare_columns(pipeline, columns)
+    workers = workers or os.cpu_count() or 1
+    shards = _shards(rows, workers, shard_rows)
+    if workers == 1 or len(shards) <= 1:
+        return _result(pipeline, _evaluate(pipeline, columns))
+
+    shms = []
+    try:
+        column_specs = {name: _share((rows,), column.dtype, shms, column)
+                        for name, column in columns.items() if column.ndim}
+        scalars = {name: column for name, column in columns.items() if not column.ndim}
+        output_shms = len(shms)
+        # the outputs get the dtypes of a single-process run, e.g. integer R of snow_loads
+        first_row = _evaluate(pipeline, {name: column[:1] if column.ndim else column
+                                         for name, column in columns.items()})
+        output_specs = [_share((rows,), np.asarray(output).dtype, shms) for output in first_row]
+
+        with ProcessPoolExecutor(min(workers, len(shards)), mp_context=mp_context, initializer=_init_worker,
+                                 initargs=(pipeline, column_specs, scalars, output_specs)) as pool:
+            for future in [pool.submit(_run_shard, start, stop) for start, stop in shards]:
+                future.result()
+        return _result(pipeline, tuple(_copy_shared(shm, spec) for shm, spec in zip(shms[output_shms:], output_specs)))
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
+class ChunkedExecutor:
+    """Evaluates elementwise functions of large arrays in chunks on a thread pool; numpy releases the GIL in most
+    ufunc loops, so the chunks run on several cores.
+
+    >>> executor = ChunkedExecutor(workers=32)
+    >>> qz = executor(ch26.eq26p10d1_qz, Kz, Kzt, Kd, Ke, V)
+
+    workers: number of threads, by default os.cpu_count()
+    threshold: calls with fewer elements than this are evaluated directly
+    chunk_size: elements per chunk, rounded up to a multiple of SHARD_ALIGNMENT; the default keeps the chunks of a
+        few float arrays in a core's cache
+    """
+
+    def __init__(self, workers=None, threshold=1_000_000, chunk_size=65_536):
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.chunk_size = max(SHARD_ALIGNMENT, -(-chunk_size // SHARD_ALIGNMENT) * SHARD_ALIGNMENT)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        """Stop the threads; they are started again by the next chunked call."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="asce7-chunk")
+            return self._pool
+
+    def __call__(self, func, *args, **kwargs):
+        """func(*args, **kwargs), with the array arguments (which broadcast together) evaluated in chunks along the
+        leading axis of their broadcast shape; calls that cannot be split along that axis are evaluated directly.
+
+        func must be elementwise: each element of the result depends only on the same elements of the arguments.
+        """
+
+        arrays = [np.asarray(v) for v in (*args, *kwargs.values())]
+        shape = np.broadcast_shapes(*(a.shape for a in arrays))
+        size = int(np.prod(shape))
+        if self.workers == 1 or size < self.threshold or size <= self.chunk_size:
+            return func(*args, **kwargs)
+
+        # chunks are slices along the leading axis of the broadcast shape, starting at multiples of SHARD_ALIGNMENT
+        # elements; arguments broadcast along that axis are passed whole, so no argument is copied
+        inner = size // shape[0]
+        step = SHARD_ALIGNMENT // math.gcd(inner, SHARD_ALIGNMENT)
+        rows = max(step, self.chunk_size // inner // step * step)
+        if rows >= shape[0]:
+            return func(*args, **kwargs)
+        sliced = [len(shape) == a.ndim and a.shape[0] > 1 for a in arrays]
+
+        def evaluate(start, stop):
+            chunk = [a[start:stop] if s else a for a, s in zip(arrays, sliced)]
+            return func(*chunk[:len(args)], **dict(zip(kwargs, chunk[len(args):])))
+
+        # the first chunk gives the result dtype for the preallocated output
+        first = np.asarray(evaluate(0, rows))
+        out = np.empty(shape, dtype=first.dtype)
+        out[:rows] = first
+
+        def fill(start):
+            stop = min(start + rows, shape[0])
+            out[start:stop] = evaluate(start, stop)
+
+        pool = self._get_pool()
+        for future in [pool.submit(fill, start) for start in range(rows, shape[0], rows)]:
+            future.result()
+        return out
+
+    def wrap(self, func):
+        """func evaluated with this executor."""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self(func, *args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,114 @@
+"""Parsing of the human readable table and figure strings kept in the chapter modules.
+
+The strings are laid out in columns separated by two or more spaces:
+
+- a line starting in the first column with a label followed by numbers is a data row
+- an indented line of numbers after a data row continues the data row above it (same label)
+- an indented line of numbers before any data row is a figure axis
+- any other line is header text
+- blank lines separate tables; a block without data rows is header text of the table that follows it
+
+Parsed tables are cached in memory, keyed by the string.
+"""
+
+import re
+from typing import NamedTuple
+import numpy as np
+
+_COLUMN_SEP_RE = re.compile(r"\s{2,}")
+_MEMORY_CACHE = {}
+
+
+class Table(NamedTuple):
+    """A parsed table.
+
+    header: tokens of each header text line
+    axes: numeric figure axis lines, as float arrays
+    labels: label of each data row
+    values: float array with one row per data row, nan padded when rows are ragged
+    """
+    header: tuple
+    axes: tuple
+    labels: tuple
+    values: np.ndarray
+
+
+def _is_number(token):
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_block(lines):
+    header, axes, labels, rows = [], [], [], []
+    for line in lines:
+        tokens = _COLUMN_SEP_RE.split(line.strip())
+        indented = line[:1].isspace()
+        if not indented and len(tokens) > 1 and all(_is_number(t) for t in tokens[1:]):
+            labels.append(tokens[0])
+            rows.append([float(t) for t in tokens[1:]])
+        elif indented and all(_is_number(t) for t in tokens):
+            if rows:
+                labels.append(labels[-1])
+                rows.append([float(t) for t in tokens])
+            else:
+                axes.append(np.array([float(t) for t in tokens]))
+        else:
+            header.append(tuple(tokens))
+    return header, axes, labels, rows
+
+
+def _values_array(rows):
+    width = max(len(row) for row in rows)
+    values = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        values[i, :len(row)] = row
+    return values
+
+
+def _parse(text):
+    tables = []
+    header, axes = [], []
+    for block in re.split(r"\n[ \t]*\n", text):
+        lines = [line.rstrip() for line in block.splitlines() if line.strip()]
+        if not lines:
+            continue
+        block_header, block_axes, labels, rows = _parse_block(lines)
+        header.extend(block_header)
+        axes.extend(block_axes)
+        if rows:
+            tables.append(Table(tuple(header), tuple(axes), tuple(labels), _values_array(rows)))
+            header, axes = [], []
+    return tuple(tables)
+
+
+def _read_only(tables):
+    for table in tables:
+        for arr in (table.values, *table.axes):
+            arr.setflags(write=False)
+    return tables
+
+
+def parse_tables(text):
+    """Parse a table string into a tuple of `Table`, one per blank line separated table with data rows.
+
+    Results are cached in memory; the arrays are read only.
+    """
+
+    try:
+        return _MEMORY_CACHE[text]
+    except KeyError:
+        pass
+    tables = _MEMORY_CACHE[text] = _read_only(_parse(text))
+    return tables
+
+
+def parse_table(text):
+    """Parse a string holding a single table into a `Table`."""
+
+    tables = parse_tables(text)
+    if len(tables) != 1:
+        raise ValueError(f"expected one table, found {len(tables)}")
+    return tables[0]
@@ -1,20 +1,56 @@
-"""Implementation of the ASCE 7 2016 building code."""
+"""Implementation of the ASCE 7 2016 building code.
+
+Chapter modules, and their aliases below, are imported on first access so that importing the package does not pull
+in their dependencies (e.g. scipy and numba).
+"""
 from functools import partial
+from importlib import import_module
+import os
 
 from .chapter1 import importance_factor, Risk, LoadType
-# from . import chapter2 as load_combinations
-# from . import chapter7 as snow
-# from . import chapter11 as seismic
-# from . import chapter12 as seismic_building
-# from . import chapter13 as seismic_nonstructural_component
-# from . import chapter15 as seismic_nonbuilding_structure
-# from . import chapter26 as wind
-# from . import chapter27 as wind_building_directional
-# from . import chapter28 as wind_building_envelope
-# from . import chapter29 as wind_other_structures
-# from . import chapter30 as wind_components_and_cladding
+
+_SUBMODULE_ALIASES = dict(
+    load_combinations="chapter2",
+    snow="chapter7",
+    seismic="chapter11",
+    seismic_building="chapter12",
+    seismic_nonstructural_component="chapter13",
+    seismic_nonbuilding_structure="chapter15",
+    wind="chapter26",
+    wind_building_directional="chapter27",
+    wind_building_envelope="chapter28",
+    wind_other_structures="chapter29",
+    wind_components_and_cladding="chapter30",
+)
+_SUBMODULES = frozenset(_SUBMODULE_ALIASES.values())
 
 __version__ = "0.1"
 
 I_s = partial(importance_factor, load_type="S")
 I_e = partial(importance_factor, load_type="E")
+
+
+def warmup():
+    """Import every chapter and build its interpolants now, e.g. when a long running server starts."""
+    for submodule in sorted(_SUBMODULES):
+        module = __getattr__(submodule)
+        if hasattr(module, "warmup"):
+            module.warmup()
+
+
+def __getattr__(name):
+    submodule = _SUBMODULE_ALIASES.get(name, name)
+    if submodule not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{submodule}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted({*globals(), *_SUBMODULE_ALIASES, *_SUBMODULES})
+
+
+if os.environ.get("ASCE7_PROFILE"):
+    from asce7.instrument import enable_from_environment
+    enable_from_environment()
@@ -3,6 +3,8 @@ GENERAL
 """
 
 from enum import Enum
+import numpy as np
+from asce7.common import label_codes
 
 
 class LoadType(str, Enum):
@@ -48,7 +50,16 @@ TABLE_1P5D2_Ix = {load_type: dict(zip(Risk,lst))
                                          LoadType.seismic: [1.00, 1.00, 1.25, 1.50]}.items()
                   }
 
+# dense risk x load type form of Table 1.5-2, indexed by integer codes (positions in Risk and TABLE_1P5D2_Ix)
+TABLE_1P5D2_Ix_ARRAY = np.array([[TABLE_1P5D2_Ix[load_type][risk] for load_type in TABLE_1P5D2_Ix] for risk in Risk])
+
 
 def importance_factor(risk, load_type):
-    """cf. Table 1.5-2 Importance Factors"""
-    return TABLE_1P5D2_Ix[load_type][risk]
+    """cf. Table 1.5-2 Importance Factors
+
+    risk and load_type can also be arrays (or sequences) of labels, enum members or integer codes (positions in `Risk`
+    and in `TABLE_1P5D2_Ix`), in which case a float array is returned.
+    """
+    if isinstance(risk, str) and isinstance(load_type, str):
+        return TABLE_1P5D2_Ix[load_type][risk]
+    return TABLE_1P5D2_Ix_ARRAY[label_codes(risk, Risk), label_codes(load_type, TABLE_1P5D2_Ix)]
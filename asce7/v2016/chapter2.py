@@ -2,33 +2,51 @@
 COMBINATIONS OF LOADS
 """
 
+from typing import NamedTuple
+import re
+import numpy as np
 from ceng.load import Combination
 
+LOAD_TYPES = ("D", "L", "Lr", "S", "R", "W")
+_LOAD_TYPE_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+def _combination(expr):
+    """Decorator implementing a load combination method, keeping the `Combination` on it for the envelope engine."""
+
+    combination = Combination(expr)
+
+    def decorator(func):
+        func.combination = combination
+        return combination.method(func)
+
+    return decorator
+
 
 class Strength:
     """cf. Section 2.3"""
 
-    @Combination("1.4*D").method
+    @_combination("1.4*D")
     def dead_load(self, D=0):
         """Strength Load Combo 1"""
         ...
 
-    @Combination("1.2*D & 1.6*L & 0.5*(Lr | S | R)").method
+    @_combination("1.2*D & 1.6*L & 0.5*(Lr | S | R)")
     def live_primary_load(self, D=0, L=0, Lr=0, S=0, R=0):
         """Strength Load Combo 2"""
         ...
 
-    @Combination("1.2*D & 1.6*(S | Lr | R) & (1.0*L | 0.5*W)").method
+    @_combination("1.2*D & 1.6*(S | Lr | R) & (1.0*L | 0.5*W)")
     def roof_snow_rain_primary_load(self, D=0, S=0, Lr=0, R=0, L=0, W=0):
         """Strength Load Combo 3"""
         ...
 
-    @Combination("1.2*D & W & L & 0.5*(Lr | S | R)").method
+    @_combination("1.2*D & W & L & 0.5*(Lr | S | R)")
     def wind_primary_load(self, D=0, W=0, L=0, Lr=0, S=0, R=0):
         """Strength Load Combo 4"""
         ...
 
-    @Combination("0.9*D & W").method
+    @_combination("0.9*D & W")
     def wind_up_load(self, D=0, W=0):
         """Strength Load Combo 5"""
         ...
@@ -37,37 +55,260 @@ class Strength:
 class ASD:
     """cf. Section 2.4"""
 
-    @Combination("D").method
+    @_combination("D")
     def dead_load(self, D=0):
         """ASD Load Combo 1"""
         ...
 
-    @Combination("D & L").method
+    @_combination("D & L")
     def live_load(self, D=0, L=0):
         """ASD Load Combo 2"""
         ...
 
-    @Combination("D & (S | Lr | R)").method
+    @_combination("D & (S | Lr | R)")
     def roof_snow_rain_load(self, D=0, S=0, Lr=0, R=0):
         """ASD Load Combo 3"""
         ...
 
-    @Combination("D & 0.75*L & 0.75*(Lr | S | R)").method
+    @_combination("D & 0.75*L & 0.75*(Lr | S | R)")
     def live_primary_load(self, D=0, L=0, Lr=0, S=0, R=0):
         """ASD Load Combo 4"""
         ...
 
-    @Combination("D & 0.6*W").method
+    @_combination("D & 0.6*W")
     def wind_down_load(self, D=0, W=0):
         """ASD Load Combo 5"""
         ...
 
-    @Combination("D & 0.75*L & 0.75*0.6*W & 0.75*(Lr | S | R)").method
+    @_combination("D & 0.75*L & 0.75*0.6*W & 0.75*(Lr | S | R)")
     def wind_primary_load(self, D=0, L=0, W=0, Lr=0, S=0, R=0):
         """ASD Load Combo 6"""
         ...
 
-    @Combination("0.6*D & 0.6*W").method
+    @_combination("0.6*D & 0.6*W")
     def wind_up_load(self, D=0, W=0):
         """ASD Load Combo 7"""
         ...
+
+
+def combinations(cls):
+    """The (method name, Combination) pairs of a load combination class, in Load Combo order."""
+    if not isinstance(cls, type):
+        cls = type(cls)
+    return tuple((name, attr.combination) for name, attr in vars(cls).items() if hasattr(attr, "combination"))
+
+
+def combination_load_types(combination):
+    """The load types of a `Combination`, in the order of the columns of its matrix (their order in the expression)."""
+    return tuple(_LOAD_TYPE_RE.findall(combination.expr))
+
+
+class Envelope(NamedTuple):
+    """Max/min envelope of a set of load combinations.
+
+    The combination indices count from 0 for Load Combo 1; the alternative indices are the rows of the
+    `Combination.matrix` of the governing combination.
+    """
+    max: np.ndarray
+    min: np.ndarray
+    max_combination: np.ndarray
+    max_alternative: np.ndarray
+    min_combination: np.ndarray
+    min_alternative: np.ndarray
+
+
+class CompiledCombinations:
+    """Every load combination of a class, `|` alternatives included, expanded once into a coefficient matrix.
+
+    coefficients: (alternatives x LOAD_TYPES) load factors, read only
+    combination_index: combination of each row (0 for Load Combo 1)
+    alternative_index: row of the combination's `Combination.matrix` for each row
+    names: the combination method names
+    removed: (method name, alternative) pairs pruned away by `prune`
+    """
+
+    load_types = LOAD_TYPES
+    removed = ()
+
+    def __init__(self, cls):
+        coefficients, combination_index, alternative_index = [], [], []
+        named_combinations = combinations(cls)
+        for index, (_, combination) in enumerate(named_combinations):
+            for alternative, factors in enumerate(combination.matrix):
+                factor_dict = dict(zip(combination_load_types(combination), factors))
+                coefficients.append([factor_dict.get(load_type, 0.0) for load_type in self.load_types])
+                combination_index.append(index)
+                alternative_index.append(alternative)
+
+        self.names = tuple(name for name, _ in named_combinations)
+        self.coefficients = np.array(coefficients, dtype=float)
+        self.combination_index = np.array(combination_index)
+        self.alternative_index = np.array(alternative_index)
+        for arr in (self.coefficients, self.combination_index, self.alternative_index):
+            arr.setflags(write=False)
+        self._pruned = {}
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({len(self.names)} combinations, {len(self.coefficients)} alternatives, "
+                f"{len(self.removed)} removed)")
+
+    def prune(self, signs):
+        """Remove the alternatives that can never govern the max or the min envelope given the load signs.
+
+        signs: mapping of load type to 1 (load is never negative), -1 (never positive) or 0 (either sign); load types
+        that are not given may have either sign
+
+        An alternative is removed when, for every allowed load, another alternative is at least as large (so it never
+        governs the max) and another one is at least as small (so it never governs the min). Envelopes are unchanged,
+        and the combination and alternative indices still refer to the full set.
+        """
+        unknown = signs.keys() - set(self.load_types)
+        if unknown:
+            raise TypeError(f"unexpected load types: {', '.join(sorted(unknown))}")
+        if not set(signs.values()) <= {-1, 0, 1}:
+            raise ValueError("signs must be 1, -1 or 0")
+
+        key = tuple(signs.get(load_type, 0) for load_type in self.load_types)
+        try:
+            return self._pruned[key]
+        except KeyError:
+            pass
+
+        sign_arr = np.array(key)
+        # diff[j, i] is row j minus row i, oriented so that >= 0 means row j is at least as large as row i
+        diff = (self.coefficients[:, None, :] - self.coefficients[None, :, :]) * sign_arr
+        fixed = sign_arr == 0
+        same_fixed = np.all(self.coefficients[:, None, fixed] == self.coefficients[None, :, fixed], axis=-1)
+        identical = np.all(self.coefficients[:, None, :] == self.coefficients[None, :, :], axis=-1)
+        # of identical rows only the first is kept
+        earlier = np.arange(len(self.coefficients))[:, None] < np.arange(len(self.coefficients))[None, :]
+        eligible = same_fixed & (~identical | earlier)
+        dominated_max = np.any(eligible & np.all(diff >= 0, axis=-1), axis=0)
+        dominated_min = np.any(eligible & np.all(diff <= 0, axis=-1), axis=0)
+        keep = ~(dominated_max & dominated_min)
+
+        pruned = object.__new__(type(self))
+        pruned.names = self.names
+        pruned.coefficients, pruned.combination_index, pruned.alternative_index = (
+            arr[keep] for arr in (self.coefficients, self.combination_index, self.alternative_index))
+        for arr in (pruned.coefficients, pruned.combination_index, pruned.alternative_index):
+            arr.setflags(write=False)
+        pruned.removed = tuple((self.names[index], int(alternative)) for index, alternative in
+                               zip(self.combination_index[~keep], self.alternative_index[~keep]))
+        pruned._pruned = {}
+        self._pruned[key] = pruned
+        return pruned
+
+    def load_array(self, **loads):
+        """Stack the loads into a (load types x cases) array; missing loads are 0."""
+        unknown = loads.keys() - set(self.load_types)
+        if unknown:
+            raise TypeError(f"unexpected load types: {', '.join(sorted(unknown))}")
+        return np.stack(np.broadcast_arrays(*(np.asarray(loads.get(load_type, 0.0), dtype=float)
+                                              for load_type in self.load_types)))
+
+    def evaluate(self, **loads):
+        """Results of every combination alternative, shape (alternatives, *load shape), as one matrix product."""
+        load_arr = self.load_array(**loads)
+        shape = load_arr.shape[1:]
+        return (self.coefficients @ load_arr.reshape(len(self.load_types), -1)).reshape(-1, *shape)
+
+    def envelope(self, **loads):
+        """The `Envelope` of every combination alternative."""
+        results = self.evaluate(**loads)
+        max_row, min_row = results.argmax(axis=0), results.argmin(axis=0)
+
+        return Envelope(
+            max=results.max(axis=0),
+            min=results.min(axis=0),
+            max_combination=self.combination_index[max_row],
+            max_alternative=self.alternative_index[max_row],
+            min_combination=self.combination_index[min_row],
+            min_alternative=self.alternative_index[min_row],
+        )
+
+
+def envelope(cls, signs=None, **loads):
+    """Evaluate every load combination of `cls` (`Strength` or `ASD`), each `|` alternative included, and return
+    the `Envelope`.
+
+    signs: optional load signs (see `CompiledCombinations.prune`); dominated alternatives are skipped
+    loads: D, L, Lr, S, R, W values or arrays that broadcast together (e.g. N cases x M members); missing loads are 0
+    """
+    compiled = cls.compiled if signs is None else cls.compiled.prune(signs)
+    return compiled.envelope(**loads)
+
+
+Strength.compiled = CompiledCombinations(Strength)
+ASD.compiled = CompiledCombinations(ASD)
+
+
+class StreamEnvelope(NamedTuple):
+    """Envelope of a stream of load case chunks over all of the cases, with the governing case (row of the stream)."""
+    max: np.ndarray
+    min: np.ndarray
+    max_combination: np.ndarray
+    max_alternative: np.ndarray
+    min_combination: np.ndarray
+    min_alternative: np.ndarray
+    max_case: np.ndarray
+    min_case: np.ndarray
+
+
+def _chunk_loads(chunk):
+    """The load arrays of a chunk given as a mapping or a structured array; other fields of a structured array (e.g.
+    member ids) are ignored."""
+    if isinstance(chunk, np.ndarray):
+        return {name: chunk[name] for name in chunk.dtype.names if name in LOAD_TYPES}
+    return chunk
+
+
+def envelope_stream(cls, chunks, signs=None):
+    """Yield the `Envelope` of each chunk of load cases, so memory use is bounded by the chunk size.
+
+    chunks: iterable of load case chunks, each a mapping of load type to array (other keys raise TypeError) or a
+    structured array with load type fields (e.g. cases x members)
+    signs: optional load signs (see `CompiledCombinations.prune`)
+    """
+    compiled = cls.compiled if signs is None else cls.compiled.prune(signs)
+    for chunk in chunks:
+        yield compiled.envelope(**_chunk_loads(chunk))
+
+
+def reduce_envelopes(envelopes):
+    """Reduce a stream of chunk envelopes (e.g. from `envelope_stream`) over their first (case) axis into a running
+    `StreamEnvelope`. Ties go to the earliest case.
+    """
+
+    result = None
+    offset = 0
+
+    for env in envelopes:
+        max_case, min_case = env.max.argmax(axis=0), env.min.argmin(axis=0)
+        max_, max_combination, max_alternative = (np.take_along_axis(arr, max_case[None], axis=0)[0]
+                                                  for arr in (env.max, env.max_combination, env.max_alternative))
+        min_, min_combination, min_alternative = (np.take_along_axis(arr, min_case[None], axis=0)[0]
+                                                  for arr in (env.min, env.min_combination, env.min_alternative))
+        chunk_result = StreamEnvelope(max_, min_, max_combination, max_alternative, min_combination, min_alternative,
+                                      max_case + offset, min_case + offset)
+        offset += len(env.max)
+
+        if result is None:
+            result = chunk_result
+            continue
+
+        new_max, new_min = chunk_result.max > result.max, chunk_result.min < result.min
+        result = StreamEnvelope(
+            max=np.where(new_max, chunk_result.max, result.max),
+            min=np.where(new_min, chunk_result.min, result.min),
+            max_combination=np.where(new_max, chunk_result.max_combination, result.max_combination),
+            max_alternative=np.where(new_max, chunk_result.max_alternative, result.max_alternative),
+            min_combination=np.where(new_min, chunk_result.min_combination, result.min_combination),
+            min_alternative=np.where(new_min, chunk_result.min_alternative, result.min_alternative),
+            max_case=np.where(new_max, chunk_result.max_case, result.max_case),
+            min_case=np.where(new_min, chunk_result.min_case, result.min_case),
+        )
+
+    if result is None:
+        raise ValueError("no envelopes to reduce")
+    return result
@@ -2,7 +2,11 @@
 WIND LOADS: GENERAL REQUIREMENTS
 """
 
+from types import SimpleNamespace
 import numpy as np
+from asce7.cache import LRUCache
+from asce7.common import label_codes
+from asce7.tables import parse_table
 
 #############################################################
 # 26.10 Velocity Pressure
@@ -11,9 +15,19 @@ import numpy as np
 # 26.10.1 Velocity Pressure Coefficient Kz
 
 TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_STR = """
-# TODO
+Exposure    α       zg (ft)
+B           7.0     1200
+C           9.5     900
+D           11.5    700
 """[1:-1]
 
+TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_TABLE = parse_table(TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_STR)
+
+TABLE26P11D1_NS = SimpleNamespace()
+TABLE26P11D1_NS.exposure = TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_TABLE.labels
+TABLE26P11D1_NS.α = TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_TABLE.values[:, 0]
+TABLE26P11D1_NS.zg = TABLE26P11D1_TERRAIN_EXPOSURE_CONSTANTS_TABLE.values[:, 1]  # ft
+
 
 # 26.10.2 Velocity Pressure qz
 
@@ -35,11 +49,83 @@ def eq26p10d1_Ke(zg):
     return np.exp(-0.0000362*zg)
 
 
-def eq26p10d1_Kz(z):
-    """
+def eq26p10d1_Kz(z, exposure):
+    """Velocity pressure exposure coefficient, Kz, evaluated at height z (ft) for exposure category "B", "C" or "D"
+    (labels or codes); z and exposure can be arrays that broadcast together.
+
     For 15 ft ≤ z ≤ zg:
     Kz =2.01*(z∕zg)**(2∕α)
     For z < 15 ft:
     Kz =2.01(15∕zg)**(2∕α)
+
+    α and zg from Table 26.11-1: Terrain Exposure Constants. Heights above zg are taken as zg.
+    """
+    codes = label_codes(exposure, TABLE26P11D1_NS.exposure)
+    α, zg = TABLE26P11D1_NS.α[codes], TABLE26P11D1_NS.zg[codes]
+    return 2.01*(np.clip(z, 15, zg)/zg)**(2/α)
+
+
+def velocity_pressure(z, exposure, V, Kd, Kzt=1.0, ground_elevation=0.0):
+    """Velocity pressure, qz (lb∕ft2), at heights z (ft), from Equation 26.10-1 with Kz and Ke.
+
+    exposure: exposure category, "B", "C" or "D" (labels or codes)
+    V: basic wind speed (mi∕h)
+    Kd: wind directionality factor
+    Kzt: topographic factor
+    ground_elevation: ground elevation above sea level (ft)
+
+    All arguments broadcast together, e.g. a floors x 1 array of z against 1 x buildings arrays of the others.
+    """
+    Kz = eq26p10d1_Kz(z, exposure)
+    Ke = eq26p10d1_Ke(ground_elevation)
+    return eq26p10d1_qz(Kz, Kzt, Kd, Ke, V)
+
+
+class SiteProfile:
+    """Velocity pressure, qz (lb∕ft2), of one site precomputed on a grid of heights (ft).
+
+    Between 15 ft and zg, Kz is a power of z, so interpolating log(qz) linearly in log(z) reproduces Equation 26.10-1
+    to rounding. Kz is constant below 15 ft and above zg; other heights outside the grid are evaluated from the
+    equation.
     """
-    ...  # TODO
+
+    def __init__(self, exposure, V, Kd, Kzt=1.0, ground_elevation=0.0, heights=None):
+        self.exposure = TABLE26P11D1_NS.exposure[int(label_codes(exposure, TABLE26P11D1_NS.exposure))]
+        self.V, self.Kd, self.Kzt, self.ground_elevation = V, Kd, Kzt, ground_elevation
+        self._zg = TABLE26P11D1_NS.zg[TABLE26P11D1_NS.exposure.index(self.exposure)]
+        if heights is None:
+            heights = np.geomspace(15, self._zg, 64)
+        self.heights = np.sort(np.asarray(heights, dtype=float))
+        self.qz = self.exact(self.heights)
+        self._log_heights, self._log_qz = np.log(self.heights), np.log(self.qz)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(exposure={self.exposure!r}, V={self.V}, Kd={self.Kd}, Kzt={self.Kzt}, "
+                f"ground_elevation={self.ground_elevation})")
+
+    def exact(self, z):
+        """qz at heights z, evaluated from Equation 26.10-1."""
+        return velocity_pressure(z, self.exposure, self.V, self.Kd, self.Kzt, self.ground_elevation)
+
+    def __call__(self, z):
+        """qz at heights z, interpolated from the grid."""
+        z = np.clip(z, 15, self._zg)
+        qz = np.exp(np.interp(np.log(z), self._log_heights, self._log_qz))
+        outside = (z < self.heights[0]) | (z > self.heights[-1])
+        if np.any(outside):
+            qz = np.where(outside, self.exact(z), qz)
+        return qz
+
+
+SITE_PROFILES = LRUCache(maxsize=128)
+
+
+def site_profile(exposure, V, Kd, Kzt=1.0, ground_elevation=0.0):
+    """The `SiteProfile` for a set of site parameters, built once and kept in the `SITE_PROFILES` cache."""
+    exposure = TABLE26P11D1_NS.exposure[int(label_codes(exposure, TABLE26P11D1_NS.exposure))]
+    key = (exposure, float(V), float(Kd), float(Kzt), float(ground_elevation))
+    profile = SITE_PROFILES.get(key)
+    if profile is None:
+        profile = SiteProfile(*key)
+        SITE_PROFILES.put(key, profile)
+    return profile
@@ -11,8 +11,9 @@ MAIN WIND FORCE RESISTING SYSTEM (DIRECTIONAL PROCEDURE)
 """
 
 from types import SimpleNamespace
-from asce7.common import Log, Deg, attach_filter
-from ceng.interp import interp_dict, interp1d
+from asce7.cache import scalar_cache
+from asce7.common import Log, Deg, attach_filter, build_once, lazy_attributes, label_codes, interp_weights
+from asce7.tables import parse_table
 import numpy as np
 
 ##########################################################
@@ -37,31 +38,35 @@ Zone    GCrn_nom
 3       2.3     0.50    0.15    2.3     0.50    0.15    3.5     0.80    0.50    3.5     0.80    0.50
 """[1:-1]
 
+FIG29P4D7_GCrn_nom_TABLE = parse_table(_FIG29P4D7_GCrn_nom__STR)
+
 FIG29P4D7_γa_NS = SimpleNamespace()
-FIG29P4D7_γa_NS.zone = list("123")  # roof zone (strings!)
-FIG29P4D7_γa_NS.tilt = (0, 5, 15, 35)  # deg - interpolate, inclusive
-FIG29P4D7_γa_NS.area = tuple(Log(v) for v in (1, 500, 5000))  # psf - interpolate, log10
-FIG29P4D7_γa_NS.GCrn_nom = ([[1.5, 0.35, 0.10],
-                             [1.5, 0.35, 0.10],
-                             [2.0, 0.56, 0.30],
-                             [2.0, 0.56, 0.30], ],
-                            [[2.0, 0.45, 0.15],
-                             [2.0, 0.45, 0.15],
-                             [2.9, 0.65, 0.40],
-                             [2.9, 0.65, 0.40], ],
-                            [[2.3, 0.50, 0.15],
-                             [2.3, 0.50, 0.15],
-                             [3.5, 0.80, 0.50],
-                             [3.5, 0.80, 0.50], ],
-                            )
-
-FIG29P4D7_GCrn_nom_DICT = interp_dict(
-    x=FIG29P4D7_γa_NS.tilt,
-    y=FIG29P4D7_γa_NS.area,
-    z=dict(zip(FIG29P4D7_γa_NS.zone, FIG29P4D7_γa_NS.GCrn_nom)),
-    axis=0
+FIG29P4D7_γa_NS.zone = list(FIG29P4D7_GCrn_nom_TABLE.labels)  # roof zone (strings!)
+FIG29P4D7_γa_NS.tilt = tuple(FIG29P4D7_GCrn_nom_TABLE.axes[1].tolist())  # deg - interpolate, inclusive
+FIG29P4D7_γa_NS.area = tuple(Log(v) for v in FIG29P4D7_GCrn_nom_TABLE.axes[0].tolist())  # psf - interpolate, log10
+FIG29P4D7_γa_NS.GCrn_nom = tuple(  # zone x tilt x area
+    FIG29P4D7_GCrn_nom_TABLE.values.reshape(len(FIG29P4D7_γa_NS.zone), len(FIG29P4D7_γa_NS.tilt), -1).tolist()
 )
 
+# plain float log10 area axis used for lookups (FIG29P4D7_γa_NS.area holds the same as Log)
+FIG29P4D7_LOG_AREA = np.log10(FIG29P4D7_GCrn_nom_TABLE.axes[0])
+# zone x tilt x log10(area) grid of the whole figure
+FIG29P4D7_GCrn_nom_GRID = np.array(FIG29P4D7_γa_NS.GCrn_nom)
+FIG29P4D7_GCrn_nom_GRID_TILT = np.array(FIG29P4D7_γa_NS.tilt)
+
+
+@build_once
+def fig29p4d7_GCrn_nom_dict():
+    """Figure 29.4-7 interpolants by roof zone (`FIG29P4D7_GCrn_nom_DICT`), built on first use."""
+    from ceng.interp import interp_dict
+
+    return interp_dict(
+        x=FIG29P4D7_γa_NS.tilt,
+        y=FIG29P4D7_LOG_AREA,
+        z=dict(zip(FIG29P4D7_γa_NS.zone, FIG29P4D7_γa_NS.GCrn_nom)),
+        axis=0
+    )
+
 
 def filter29p4p3(θ, roof_type, Lp, ω, h1, h2):
     """Section 29.4.3: Rooftop Solar Panels for Buildings of All Heights with Flat Roofs or Gable or Hip Roofs with
@@ -75,7 +80,7 @@ def filter29p4p3(θ, roof_type, Lp, ω, h1, h2):
     h2 (ft)
     """
     return (θ <= Deg(7)) & \
-           np.in1d(roof_type, ["flat", "gable", "hip"]) & \
+           np.isin(roof_type, ["flat", "gable", "hip"]) & \
            (Lp <= 6.7) & \
            (ω <= Deg(35)) & \
            (h1 <= 2) & \
@@ -92,14 +97,47 @@ def eq29p4d5_p(qh, GCrn):
     return qh * GCrn
 
 
+@scalar_cache
 @attach_filter(filter29p4p3)
 def eq29p4d6_GCrn_nom(zone, tilt, area):
     """For Equation 29.4-6: Nominal Net Pressure Coefficient, (GCrn)nom
 
     From Figure 29.4-7: Design Wind Loads (All Heights): Rooftop Solar Panels for Enclosed and Partially Enclosed
     Buildings, Roof θ≤7°
+
+    zone, tilt and area can be arrays; zone as labels or zone numbers (the nearest zone is used).
     """
-    return FIG29P4D7_GCrn_nom_DICT[zone](tilt, Log(area))
+    if isinstance(zone, str) and np.ndim(tilt) == 0 and np.ndim(area) == 0:
+        return fig29p4d7_GCrn_nom_dict()[zone](tilt, np.log10(area))
+    return _fig29p4d7_GCrn_nom_grid(zone, tilt, area)
+
+
+def _fig29p4d7_zone_codes(zone):
+    """Grid index of roof zone labels ("1", "2", "3") or zone numbers (nearest zone)."""
+    zone_arr = np.asarray(zone)
+    if zone_arr.dtype.kind not in "iuf":
+        return label_codes(zone_arr, FIG29P4D7_γa_NS.zone)
+    codes = np.rint(zone_arr).astype(np.intp) - int(FIG29P4D7_γa_NS.zone[0])
+    if np.any((codes < 0) | (codes >= len(FIG29P4D7_γa_NS.zone))):
+        raise ValueError("zone outside of Figure 29.4-7")
+    return codes
+
+
+def _fig29p4d7_GCrn_nom_grid(zone, tilt, area):
+    """Figure 29.4-7 for arrays of zone, tilt and area in one pass over `FIG29P4D7_GCrn_nom_GRID`: nearest zone,
+    linear in tilt and in log10(area)."""
+    zone_codes, tilt, log_area = np.broadcast_arrays(_fig29p4d7_zone_codes(zone), np.asarray(tilt, dtype=float),
+                                                     np.log10(np.asarray(area, dtype=float)))
+    for name, arr, axis in (("tilt", tilt, FIG29P4D7_GCrn_nom_GRID_TILT),
+                            ("area", log_area, FIG29P4D7_LOG_AREA)):
+        if np.any((arr < axis[0]) | (arr > axis[-1])):
+            raise ValueError(f"{name} outside of the range of Figure 29.4-7")
+
+    i, u = interp_weights(tilt, FIG29P4D7_GCrn_nom_GRID_TILT)
+    j, v = interp_weights(log_area, FIG29P4D7_LOG_AREA)
+    grid = FIG29P4D7_GCrn_nom_GRID
+    return ((1 - u)*(1 - v)*grid[zone_codes, i, j] + (1 - u)*v*grid[zone_codes, i, j + 1] +
+            u*(1 - v)*grid[zone_codes, i + 1, j] + u*v*grid[zone_codes, i + 1, j + 1])
 
 
 @attach_filter(filter29p4p3)
@@ -155,7 +193,7 @@ def filter29p4p4(θ, roof_type, Lp, ω, h2):
     h2 (ft)
     """
     return (θ <= Deg(7)) & \
-           np.in1d(roof_type, ["flat", "gable", "hip"]) & \
+           np.isin(roof_type, ["flat", "gable", "hip"]) & \
            (Lp <= 6.7) & \
            (ω <= Deg(2)) & \
            (h2 <= 10 / 12)
@@ -192,15 +230,26 @@ Effective Wind Area, A (ft2)    γa
 1000                            0.4
 """[1:-1]
 
+FIG29P4D8_γa_TABLE = parse_table(_FIG29P4D8_γa__STR)
+
 FIG29P4D8_γa_NS = SimpleNamespace()
 # X values
-FIG29P4D8_γa_NS.A = tuple(Log(v) for v in [1, 10, 100, 1000])  # effective wind area (ft2)
+FIG29P4D8_γa_NS.A = tuple(Log(float(v)) for v in FIG29P4D8_γa_TABLE.labels)  # effective wind area (ft2)
 # Y values
-FIG29P4D8_γa_NS.γa = (0.8, 0.8, 0.4, 0.4)  # solar panel pressure equalization factor
+FIG29P4D8_γa_NS.γa = tuple(FIG29P4D8_γa_TABLE.values[:, 0].tolist())  # solar panel pressure equalization factor
+# plain float log10 area axis used for lookups
+FIG29P4D8_LOG_A = np.log10([float(v) for v in FIG29P4D8_γa_TABLE.labels])
 
-FIG29P4D8_γa_INTERPOLANT = interp1d(FIG29P4D8_γa_NS.A, FIG29P4D8_γa_NS.γa)
 
+@build_once
+def fig29p4d8_γa_interpolant():
+    """Figure 29.4-8 interpolant (`FIG29P4D8_γa_INTERPOLANT`), built on first use."""
+    from ceng.interp import interp1d
 
+    return interp1d(FIG29P4D8_LOG_A, FIG29P4D8_γa_NS.γa)
+
+
+@scalar_cache
 @attach_filter(filter29p4p4)
 def eq29p4d7_γa(A):
     """For Equation 29.4-7: solar panel pressure equalization factor, γa
@@ -208,4 +257,15 @@ def eq29p4d7_γa(A):
     From Figure 29.4-8: Solar Panel Pressure Equalization Factor, γa, for Enclosed and Partially Enclosed Buildings
     of All Heights
     """
-    return FIG29P4D8_γa_INTERPOLANT(Log(A))
+    return fig29p4d8_γa_interpolant()(np.log10(A))
+
+
+#########################################
+# interpolants
+#########################################
+_LAZY_INTERPOLANTS = dict(
+    FIG29P4D7_GCrn_nom_DICT=fig29p4d7_GCrn_nom_dict,
+    FIG29P4D8_γa_INTERPOLANT=fig29p4d8_γa_interpolant,
+)
+
+warmup, __getattr__ = lazy_attributes(__name__, _LAZY_INTERPOLANTS)
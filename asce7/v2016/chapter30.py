@@ -3,7 +3,10 @@ WIND LOADS: COMPONENTS AND CLADDING
 """
 
 from types import SimpleNamespace
-from asce7.common import Deg, Log
+import numpy as np
+from asce7.cache import scalar_cache
+from asce7.common import Deg, label_codes
+from asce7.tables import parse_tables
 
 #############################################################
 # 30.3.2 Design Wind Pressures
@@ -11,6 +14,11 @@ from asce7.common import Deg, Log
 
 
 def eq30p3d1_GCp_interpolant(figure):
+    """The GCp lookup of the figure for a roof type (e.g. "gable"), or "walls".
+
+    The lookups take (location, zone, A), as scalars or as arrays for a whole cladding schedule, and return the positive
+    and negative GCp.
+    """
     return EQ30P3D1_FIGURES_GCp_LOOKUP[figure]
 
 
@@ -52,9 +60,29 @@ FIG30P3D2A_GCp_ROOF_NS.roof_type = "gable"
 FIG30P3D2A_GCp_ROOF_NS.roof_slope = (Deg(0), Deg(7))
 FIG30P3D2A_GCp_ROOF_NS.location = ("roof", "overhang")
 FIG30P3D2A_GCp_ROOF_NS.zone = ("1'", "1", "2", "3")
-FIG30P3D2A_GCp_ROOF_DICT = {
-    # TODO
-}
+FIG30P3D2A_GCp_ROOF_TABLES = parse_tables(_FIG30P3D2A_GCp_ROOF_STR)
+# direction ("down" or "up") -> zone -> (area (sq ft), GCp)
+FIG30P3D2A_GCp_ROOF_NS.curves = dict(down={}, up={})
+for _table in FIG30P3D2A_GCp_ROOF_TABLES:
+    *_zones, _direction = _table.header[-1][0].split()[1:]
+    for _zone in _zones:
+        FIG30P3D2A_GCp_ROOF_NS.curves[_direction.lower()][_zone] = tuple(tuple(row) for row in _table.values.tolist())
+del _table, _zones, _direction, _zone
+
+
+def _fig30p3d2A_GCp_roof_interpolant(zone):
+    (down_area, down_GCp), (up_area, up_GCp) = (FIG30P3D2A_GCp_ROOF_NS.curves[direction][zone]
+                                                for direction in ("down", "up"))
+    down_log_area, up_log_area = np.log10(down_area), np.log10(up_area)
+
+    def interpolant(log_A):
+        """Positive and negative GCp for log10(A); areas beyond the figure take the end values."""
+        return np.interp(log_A, down_log_area, down_GCp), np.interp(log_A, up_log_area, up_GCp)
+
+    return interpolant
+
+
+FIG30P3D2A_GCp_ROOF_DICT = {zone: _fig30p3d2A_GCp_roof_interpolant(zone) for zone in FIG30P3D2A_GCp_ROOF_NS.zone}
 
 FIG30P3D2A_GCp_DICT = {
     "roof": FIG30P3D2A_GCp_ROOF_DICT,
@@ -70,13 +98,36 @@ def filter29p4p4(h):
     return h <= 60
 
 
+@scalar_cache
 def fig30p3d2A_GCp(location, zone, A):
     """For Equation 30.3-1: Design wind pressures on C&C elements of low-rise buildings and buildings with h ≤ 60 ft
 
     From Figure 30.3-2A: Components and Cladding [h ≤ 60 ft (h ≤ 18.3 m)]: External Pressure Coefficients, (GCp),
     for Enclosed and Partially Enclosed Buildings—Gable Roofs, θ ≤ 7°
+
+    Returns the positive and negative GCp. location, zone (labels or codes) and effective wind area A (sq ft) can be
+    arrays, which are evaluated once per location and zone and returned as two arrays.
     """
-    return FIG30P3D2A_GCp_DICT[location][zone](Log(A))
+    if isinstance(location, str) and isinstance(zone, str) and np.ndim(A) == 0:
+        return FIG30P3D2A_GCp_DICT[location][zone](np.log10(A))
+
+    locations = tuple(FIG30P3D2A_GCp_DICT)
+    location_codes, zone_codes, log_A = np.broadcast_arrays(label_codes(location, locations),
+                                                            label_codes(zone, FIG30P3D2A_GCp_ROOF_NS.zone),
+                                                            np.log10(np.asarray(A, dtype=float)))
+    positive, negative = np.empty(log_A.shape), np.empty(log_A.shape)
+    for location_code, location_name in enumerate(locations):
+        for zone_code, zone_name in enumerate(FIG30P3D2A_GCp_ROOF_NS.zone):
+            mask = (location_codes == location_code) & (zone_codes == zone_code)
+            positive[mask], negative[mask] = FIG30P3D2A_GCp_DICT[location_name][zone_name](log_A[mask])
+    return positive, negative
+
+
+# zone boundaries, as multiples of h from the building edges
+FIG30P3D2A_ZONE_NS = SimpleNamespace()
+FIG30P3D2A_ZONE_NS.zone_3 = (0.2, 0.6)  # corner: within 0.2h of one edge and 0.6h of the other
+FIG30P3D2A_ZONE_NS.zone_2 = 0.6  # edge strip: within 0.6h of an edge
+FIG30P3D2A_ZONE_NS.zone_1 = 1.2  # within 1.2h of an edge; Zone 1' beyond
 
 
 def fig30p3d2A_zone_check(d1, d2, h):
@@ -84,8 +135,19 @@ def fig30p3d2A_zone_check(d1, d2, h):
 
     d1, d2: distances (ft) from two nearest building edges
     h: building height (ft) to eaves
+
+    Returns zone codes (positions in FIG30P3D2A_GCp_ROOF_NS.zone, so 0 is Zone 1' and 3 is Zone 3) for arrays of d1, d2
+    and h; points on a zone boundary take the higher zone.
     """
-    ...  # TODO
+    near, far = np.minimum(d1, d2), np.maximum(d1, d2)
+    zone_3_near, zone_3_far = FIG30P3D2A_ZONE_NS.zone_3
+    return np.select(
+        [(near <= zone_3_near*h) & (far <= zone_3_far*h),
+         near <= FIG30P3D2A_ZONE_NS.zone_2*h,
+         near <= FIG30P3D2A_ZONE_NS.zone_1*h],
+        [FIG30P3D2A_GCp_ROOF_NS.zone.index(zone) for zone in ("3", "2", "1")],
+        default=FIG30P3D2A_GCp_ROOF_NS.zone.index("1'"),
+    )
 
 
 # Fig. 30.3-3 (stepped roofs)
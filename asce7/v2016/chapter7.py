@@ -2,9 +2,12 @@
 SNOW LOADS
 """
 
+from typing import NamedTuple
 import numpy as np
-from asce7.common import Deg
-from ceng.interp import interp_dict
+from asce7.cache import scalar_cache
+from asce7.common import Deg, build_once, lazy_attributes, label_codes, interp_weights
+from asce7.tables import parse_table
+from asce7.v2016.chapter1 import importance_factor
 from types import SimpleNamespace
 
 #########################################
@@ -24,27 +27,30 @@ Alaska no trees within 2 mi radius          0.7     0.8         nan
 """[1:-1]
 
 
+TABLE7P3D1_Ce_TABLE = parse_table(_FIG7P3D1_Ce__STR)
+
 TABLE7P3D1_Ce_NS = SimpleNamespace()
-TABLE7P3D1_Ce_NS.wind_surface_roughness = ("B", "C", "D", "Windswept mountainous above tree line",
-                                           "Alaska no trees within 2 mi radius")
-TABLE7P3D1_Ce_NS.snow_exposure = ("fully", "partially", "sheltered")
-TABLE7P3D1_Ce_NS.Ce = {
-    "B": [0.9, 1.0, 1.2],
-    "C": [0.9, 1.0, 1.1],
-    "D": [0.8, 0.9, 1.0],
-    "Windswept mountainous above tree line": [0.7, 0.8, np.nan],
-    "Alaska no trees within 2 mi radius": [0.7, 0.8, np.nan],
-}
+TABLE7P3D1_Ce_NS.wind_surface_roughness = TABLE7P3D1_Ce_TABLE.labels
+TABLE7P3D1_Ce_NS.snow_exposure = tuple(s.lower() for s in TABLE7P3D1_Ce_TABLE.header[2])
+TABLE7P3D1_Ce_NS.Ce = dict(zip(TABLE7P3D1_Ce_TABLE.labels, TABLE7P3D1_Ce_TABLE.values.tolist()))
 TABLE7P3D1_Ce_DICT = dict(zip(TABLE7P3D1_Ce_NS.wind_surface_roughness,
                               (dict(zip(TABLE7P3D1_Ce_NS.snow_exposure, seq)) for seq in TABLE7P3D1_Ce_NS.Ce.values())))
+# roughness x exposure, indexed by integer codes (positions in wind_surface_roughness and snow_exposure)
+TABLE7P3D1_Ce_ARRAY = TABLE7P3D1_Ce_TABLE.values
 
 
 def table7p3d1_Ce(wind_surface_roughness, snow_exposure):
     """Figure 7.3-1 Exposure factor, Ce
 
     (Table 7.3-1 for Ce definitions)
+
+    Arrays (or sequences) of labels or integer codes are looked up in `TABLE7P3D1_Ce_ARRAY` in one indexing operation;
+    nan entries are returned as they are.
     """
-    return TABLE7P3D1_Ce_DICT[wind_surface_roughness][snow_exposure]
+    if isinstance(wind_surface_roughness, str) and isinstance(snow_exposure, str):
+        return TABLE7P3D1_Ce_DICT[wind_surface_roughness][snow_exposure]
+    return TABLE7P3D1_Ce_ARRAY[label_codes(wind_surface_roughness, TABLE7P3D1_Ce_NS.wind_surface_roughness),
+                               label_codes(snow_exposure, TABLE7P3D1_Ce_NS.snow_exposure)]
 
 
 _TABLE7P3D2_Ct__STR = """
@@ -57,24 +63,26 @@ Freezer building
 Continuously heated greenhouses with max R-value of 2                               0.85
 """[1:-1]
 
+TABLE7P3D2_Ct_TABLE = parse_table(_TABLE7P3D2_Ct__STR)
+
 TABLE7P3D2_Ct_NS = SimpleNamespace()
-TABLE7P3D2_Ct_NS.thermal_condition = (
-    "All structures except for those indicated below",
-    "Structures kept just above freezing with cold, ventilated roofs and min R-value 25",
-    "Unheated and open air structures",
-    "Freezer building",
-    "Continuously heated greenhouses with max R-value of 2",
-)
-TABLE7P3D2_Ct_NS.Ct = (1.0, 1.1, 1.2, 1.3, 0.85)
+TABLE7P3D2_Ct_NS.thermal_condition = TABLE7P3D2_Ct_TABLE.labels
+TABLE7P3D2_Ct_NS.Ct = tuple(TABLE7P3D2_Ct_TABLE.values[:, 0].tolist())
 TABLE7P3D2_Ct_DICT = dict(zip(TABLE7P3D2_Ct_NS.thermal_condition, TABLE7P3D2_Ct_NS.Ct))
+# indexed by integer codes (positions in thermal_condition)
+TABLE7P3D2_Ct_ARRAY = TABLE7P3D2_Ct_TABLE.values[:, 0]
 
 
 def table7p3d2_Ct(thermal_condition):
     """Figure 7.3-2 Thermal factor, Ct
 
     (Table 7.3-2 for Ct definitions)
+
+    Arrays (or sequences) of labels or integer codes are looked up in `TABLE7P3D2_Ct_ARRAY` in one indexing operation.
     """
-    return TABLE7P3D2_Ct_DICT[thermal_condition]
+    if isinstance(thermal_condition, str):
+        return TABLE7P3D2_Ct_DICT[thermal_condition]
+    return TABLE7P3D2_Ct_ARRAY[label_codes(thermal_condition, TABLE7P3D2_Ct_NS.thermal_condition)]
 
 
 def eq7p3d1_pf(Ce, Ct, Is, pg):
@@ -125,39 +133,72 @@ other           1.0     0       0       0
                 0       90      90      90
 """[1:-1]
 
+FIG7P4D1_Cs_TABLE = parse_table(_FIG7P4D1_Cs__STR)
+_FIG7P4D1_Cs_SURFACE_TYPES = tuple(dict.fromkeys(FIG7P4D1_Cs_TABLE.labels))
+_FIG7P4D1_Cs_ROWS = {surface_type: FIG7P4D1_Cs_TABLE.values[np.array(FIG7P4D1_Cs_TABLE.labels) == surface_type]
+                     for surface_type in _FIG7P4D1_Cs_SURFACE_TYPES}
+
 FIG7P4D1_Cs_NS = SimpleNamespace()
 # Z values
-FIG7P4D1_Cs_NS.Cs = (1.0, 1.0, 0, 0)
+FIG7P4D1_Cs_NS.Cs = tuple(_FIG7P4D1_Cs_ROWS[_FIG7P4D1_Cs_SURFACE_TYPES[0]][:, 0].tolist())
 # Y values
-FIG7P4D1_Cs_NS.Ct = (1.0, 1.1, 1.2)
+FIG7P4D1_Cs_NS.Ct = tuple(FIG7P4D1_Cs_TABLE.axes[0].tolist())
 # X values
-FIG7P4D1_Cs_NS.roof_slope = dict(
-    slippery=[
-        [Deg(v) for v in [0, 5, 70, 90]],
-        [Deg(v) for v in [0, 10, 70, 90]],
-        [Deg(v) for v in [0, 15, 70, 90]],
-    ],
-    other=[
-        [Deg(v) for v in [0, 30, 70, 90]],
-        [Deg(v) for v in [0, 37.5, 70, 90]],
-        [Deg(v) for v in [0, 45, 70, 90]],
-    ]
-)
-
-FIG7P4D1_Cs_DICT = interp_dict(
-    x=FIG7P4D1_Cs_NS.roof_slope,
-    y=FIG7P4D1_Cs_NS.Ct,
-    z=FIG7P4D1_Cs_NS.Cs,
-    axis=0
-)
+FIG7P4D1_Cs_NS.roof_slope = {
+    surface_type: [[Deg(v) for v in column] for column in rows[:, 1:].T.tolist()]
+    for surface_type, rows in _FIG7P4D1_Cs_ROWS.items()
+}
 
 
+@build_once
+def fig7p4d1_Cs_dict():
+    """Figure 7.4-1 interpolants by surface type (`FIG7P4D1_Cs_DICT`), built on first use."""
+    from ceng.interp import interp_dict
+
+    return interp_dict(
+        x=FIG7P4D1_Cs_NS.roof_slope,
+        y=FIG7P4D1_Cs_NS.Ct,
+        z=FIG7P4D1_Cs_NS.Cs,
+        axis=0
+    )
+
+
+def _fig7p4d1_Cs_array(surface_type, roof_slope, temp_coefficient):
+    """Figure 7.4-1 for arrays of roof slopes and Ct of one surface type."""
+    curves = np.array([np.interp(roof_slope, x, FIG7P4D1_Cs_NS.Cs) for x in FIG7P4D1_Cs_NS.roof_slope[surface_type]])
+    i, w = interp_weights(temp_coefficient, FIG7P4D1_Cs_NS.Ct)
+    point = np.arange(curves.shape[1])
+    return (1 - w)*curves[i, point] + w*curves[i + 1, point]
+
+
+@scalar_cache
 def fig7p4d1_Cs(surface_type, roof_slope, temp_coefficient):
     """Figure 7.4-1: Roof slope factor, Cs, for warm and cold roofs
 
     (Table 7.3-2 for Ct definitions)
+
+    Arrays of surface types (labels or codes), roof slopes and Ct are evaluated once per surface type and returned as
+    a single array.
     """
-    return FIG7P4D1_Cs_DICT[surface_type](roof_slope, temp_coefficient)
+    if isinstance(surface_type, str) and np.ndim(roof_slope) == 0 and np.ndim(temp_coefficient) == 0:
+        return fig7p4d1_Cs_dict()[surface_type](roof_slope, temp_coefficient)
+
+    surface_codes, roof_slope, temp_coefficient = np.broadcast_arrays(
+        label_codes(surface_type, _FIG7P4D1_Cs_SURFACE_TYPES),
+        np.asarray(roof_slope, dtype=float),
+        np.asarray(temp_coefficient, dtype=float),
+    )
+    slope_axis = FIG7P4D1_Cs_NS.roof_slope[_FIG7P4D1_Cs_SURFACE_TYPES[0]][0]
+    if np.any((roof_slope < slope_axis[0]) | (roof_slope > slope_axis[-1])):
+        raise ValueError("roof_slope outside of the range of Figure 7.4-1")
+    if np.any((temp_coefficient < FIG7P4D1_Cs_NS.Ct[0]) | (temp_coefficient > FIG7P4D1_Cs_NS.Ct[-1])):
+        raise ValueError("temp_coefficient outside of the range of Figure 7.4-1")
+
+    Cs = np.empty(surface_codes.shape)
+    for code, surface in enumerate(_FIG7P4D1_Cs_SURFACE_TYPES):
+        mask = surface_codes == code
+        Cs[mask] = _fig7p4d1_Cs_array(surface, roof_slope[mask], temp_coefficient[mask])
+    return Cs
 
 
 def eq7p4d1_ps(Cs, pf):
@@ -181,4 +222,59 @@ def eq7p10d1_R(pg, roof_slope, W):
     """
     pg_le_20psf_and_nonzero = (pg <= 20) & (pg > 0)
     low_slope = roof_slope < (W/50)
-    return 5 * (pg_le_20psf_and_nonzero | low_slope)
+    return 5 * (pg_le_20psf_and_nonzero & low_slope)
+
+
+#########################################
+# roof snow loads for many buildings
+#########################################
+class SnowLoads(NamedTuple):
+    """Roof snow loads (psf) from `snow_loads`."""
+    pf: np.ndarray
+    pm: np.ndarray
+    Cs: np.ndarray
+    ps: np.ndarray
+    R: np.ndarray
+    governing: np.ndarray
+
+
+def snow_loads(buildings):
+    """Roof snow loads for a table of buildings, evaluated column-wise.
+
+    buildings: mapping of column name to array, or structured array, with columns:
+        risk: risk category (Table 1.5-1)
+        pg: ground snow load (psf)
+        wind_surface_roughness, snow_exposure: Table 7.3-1 labels or codes
+        thermal_condition: Table 7.3-2 label or code
+        surface_type: Figure 7.4-1 "slippery" or "other"
+        roof_slope: roof slope (radians, e.g. Deg)
+        W: horizontal eave to ridge distance (ft)
+        roof_type (optional): "curved" or other roof types for Eq. 7.3.4-1, default not curved
+
+    Ct values beyond the curves of Figure 7.4-1 use the end curves (Ct ≤ 1.0 and Ct ≥ 1.2). The governing roof snow
+    load is max(ps + R, pm).
+    """
+    names = buildings.dtype.names if isinstance(buildings, np.ndarray) else buildings.keys()
+    roof_type = np.asarray(buildings["roof_type"]) if "roof_type" in names else "gable"
+    shape = np.broadcast_shapes(*(np.shape(buildings[name]) for name in names))
+    pg, roof_slope, W = (np.broadcast_to(np.asarray(buildings[name], dtype=float), shape)
+                         for name in ("pg", "roof_slope", "W"))
+
+    Is = importance_factor(buildings["risk"], "S")
+    Ce = table7p3d1_Ce(buildings["wind_surface_roughness"], buildings["snow_exposure"])
+    Ct = table7p3d2_Ct(buildings["thermal_condition"])
+    pf = eq7p3d1_pf(Ce, Ct, Is, pg)
+    pm = eq7p3p4d1_pm(roof_type, roof_slope, Is, pg)
+    Cs = fig7p4d1_Cs(buildings["surface_type"], roof_slope, np.clip(Ct, FIG7P4D1_Cs_NS.Ct[0], FIG7P4D1_Cs_NS.Ct[-1]))
+
+    ps = eq7p4d1_ps(Cs, pf)
+    R = eq7p10d1_R(pg, np.degrees(roof_slope), W)
+    return SnowLoads(pf, pm, Cs, ps, R, np.maximum(ps + R, pm))
+
+
+#########################################
+# interpolants
+#########################################
+_LAZY_INTERPOLANTS = dict(FIG7P4D1_Cs_DICT=fig7p4d1_Cs_dict)
+
+warmup, __getattr__ = lazy_attributes(__name__, _LAZY_INTERPOLANTS)
@@ -0,0 +1,42 @@
+"""Per-call overhead of wrapping areas in `asce7.common.Log` versus the plain float log10 path used by the lookups.
+
+Run with:
+
+    python -m benchmarks.log_overhead
+"""
+
+import timeit
+import numpy as np
+from asce7.common import Log
+from asce7.v2016 import chapter29
+
+
+def _time(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    gcrn_nom = chapter29.fig29p4d7_GCrn_nom_dict()["2"]
+    γa = chapter29.fig29p4d8_γa_interpolant()
+    cases = [
+        ("scalar", 250.0, 2000),
+        ("1e3 array", np.geomspace(1, 1000, 1_000), 2000),
+        ("1e6 array", np.geomspace(1, 1000, 1_000_000), 5),
+    ]
+
+    print(f"{'case':<32}{'Log (us)':>12}{'log10 (us)':>12}{'ratio':>8}")
+    for name, area, number in cases:
+        rows = [
+            (f"log of area, {name}", lambda: Log(area), lambda: np.log10(area)),
+            (f"γa lookup, {name}", lambda: γa(Log(area)), lambda: γa(np.log10(area))),
+        ]
+        if np.ndim(area) == 0:
+            rows.append((f"GCrn_nom lookup, {name}", lambda: gcrn_nom(10, Log(area)),
+                         lambda: gcrn_nom(10, np.log10(area))))
+        for label, before, after in rows:
+            t_before, t_after = _time(before, number), _time(after, number)
+            print(f"{label:<32}{t_before*1e6:>12.2f}{t_after*1e6:>12.2f}{t_before/t_after:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Benchmarks of the hot functions of each chapter, offline and local.
+
+Each case is timed for a scalar call and for 1e3 and 1e6 element arrays, with the peak memory (tracemalloc) of one
+call. The cold start time and peak resident memory of `import asce7.v2016` are measured in fresh interpreters.
+
+Run from the repository root:
+
+    python -m benchmarks.suite run -o results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 1.25
+
+compare exits with status 1 when a case got slower than threshold times the baseline.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+import numpy as np
+
+SIZES = (None, 1_000, 1_000_000)
+
+
+def _rng_choice(labels, size):
+    return np.random.default_rng(0).choice(labels, size)
+
+
+def _uniform(low, high, size):
+    return np.random.default_rng(1).uniform(low, high, size)
+
+
+def _chapter1(size):
+    from asce7.v2016.chapter1 import importance_factor
+    risk = "II" if size is None else _rng_choice(["I", "II", "III", "IV"], size)
+    yield "chapter1.importance_factor", lambda: importance_factor(risk, "S")
+
+
+def _chapter2(size):
+    from asce7.v2016.chapter2 import Strength, ASD, envelope
+    if size is None:
+        strength = Strength()
+        yield "chapter2.Strength.roof_snow_rain_primary_load", lambda: strength.roof_snow_rain_primary_load(
+            1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+        return
+    loads = {load_type: _uniform(0, 50, size) for load_type in ("D", "L", "Lr", "S", "R", "W")}
+    yield "chapter2.envelope[Strength]", lambda: envelope(Strength, **loads)
+    yield "chapter2.envelope[ASD]", lambda: envelope(ASD, **loads)
+
+
+def _chapter7(size):
+    from asce7.v2016 import chapter7 as ch7
+    if size is None:
+        yield "chapter7.table7p3d1_Ce", lambda: ch7.table7p3d1_Ce("C", "partially")
+        yield "chapter7.eq7p3d1_pf", lambda: ch7.eq7p3d1_pf(1.0, 1.1, 1.0, 30.0)
+        yield "chapter7.fig7p4d1_Cs", lambda: ch7.fig7p4d1_Cs("other", ch7.Deg(40), 1.1)
+        return
+    roughness = _rng_choice(["B", "C", "D"], size)
+    exposure = _rng_choice(["fully", "partially", "sheltered"], size)
+    surface_type = _rng_choice(["slippery", "other"], size)
+    roof_slope = np.radians(_uniform(0, 60, size))
+    Ct = _uniform(1.0, 1.2, size)
+    buildings = dict(risk=_rng_choice(["I", "II", "III", "IV"], size), pg=_uniform(0, 60, size),
+                     wind_surface_roughness=roughness, snow_exposure=exposure,
+                     thermal_condition=_rng_choice(ch7.TABLE7P3D2_Ct_NS.thermal_condition, size),
+                     surface_type=surface_type, roof_slope=roof_slope, W=_uniform(10, 200, size))
+    yield "chapter7.table7p3d1_Ce", lambda: ch7.table7p3d1_Ce(roughness, exposure)
+    yield "chapter7.eq7p3d1_pf", lambda: ch7.eq7p3d1_pf(1.0, Ct, 1.0, buildings["pg"])
+    yield "chapter7.fig7p4d1_Cs", lambda: ch7.fig7p4d1_Cs(surface_type, roof_slope, Ct)
+    yield "chapter7.snow_loads", lambda: ch7.snow_loads(buildings)
+
+
+def _chapter26(size):
+    from asce7.v2016 import chapter26 as ch26
+    z = 30.0 if size is None else _uniform(0, 500, size)
+    exposure = "C" if size is None else _rng_choice(["B", "C", "D"], size)
+    yield "chapter26.eq26p10d1_Kz", lambda: ch26.eq26p10d1_Kz(z, exposure)
+    yield "chapter26.velocity_pressure", lambda: ch26.velocity_pressure(z, exposure, 115, 0.85)
+    profile = ch26.site_profile("C", 115, 0.85)
+    yield "chapter26.SiteProfile", lambda: profile(z)
+
+
+def _chapter29(size):
+    from asce7.v2016 import chapter29 as ch29
+    if size is None:
+        zone, tilt, area = "2", 20.0, 250.0
+    else:
+        zone, tilt, area = _rng_choice(["1", "2", "3"], size), _uniform(0, 35, size), _uniform(1, 5000, size)
+    A = np.minimum(area, 1000.0)
+    yield "chapter29.eq29p4d6_GCrn_nom", lambda: ch29.eq29p4d6_GCrn_nom(zone, tilt, area)
+    yield "chapter29.eq29p4d7_γa", lambda: ch29.eq29p4d7_γa(A)
+    yield "chapter29.eq29p4d5_p", lambda: ch29.eq29p4d5_p(30.0, area)
+
+
+def _chapter30(size):
+    from asce7.v2016 import chapter30 as ch30
+    if size is None:
+        zone, area, d1, d2 = "2", 50.0, 3.0, 40.0
+        location = "roof"
+    else:
+        zone, area = _rng_choice(ch30.FIG30P3D2A_GCp_ROOF_NS.zone, size), _uniform(1, 3000, size)
+        d1, d2 = _uniform(0, 100, size), _uniform(0, 100, size)
+        location = np.full(size, "roof")
+    yield "chapter30.fig30p3d2A_GCp", lambda: ch30.fig30p3d2A_GCp(location, zone, area)
+    yield "chapter30.fig30p3d2A_zone_check", lambda: ch30.fig30p3d2A_zone_check(d1, d2, 20.0)
+
+
+CASES = (_chapter1, _chapter2, _chapter7, _chapter26, _chapter29, _chapter30)
+
+
+def _size_name(size):
+    return "scalar" if size is None else f"{size:.0e}".replace("+0", "")
+
+
+def _time_call(func):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def _peak_bytes(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+_IMPORT_CODE = """
+import time
+start = time.perf_counter()
+import asce7.v2016
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+except ImportError:
+    maxrss = None
+print(elapsed, maxrss)
+"""
+
+
+def _import_case(repeat=5):
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_CODE], capture_output=True, text=True, check=True).stdout
+        elapsed, maxrss = out.split()
+        runs.append((float(elapsed), None if maxrss == "None" else int(maxrss)))
+    return dict(seconds=min(elapsed for elapsed, _ in runs), peak_bytes=runs[0][1])
+
+
+def run(sizes=SIZES, match=""):
+    """Time every case; returns the results as a JSON serializable dict."""
+
+    results = {}
+    if match in "import asce7.v2016":
+        results["import asce7.v2016"] = _import_case()
+        print(f"{'import asce7.v2016':<56}{results['import asce7.v2016']['seconds']*1e6:>14.2f} us", file=sys.stderr)
+    for chapter_cases in CASES:
+        for size in sizes:
+            for name, func in chapter_cases(size):
+                key = f"{name}[{_size_name(size)}]"
+                if match not in key:
+                    continue
+                results[key] = dict(seconds=_time_call(func), peak_bytes=_peak_bytes(func))
+                print(f"{key:<56}{results[key]['seconds']*1e6:>14.2f} us{results[key]['peak_bytes']:>14,d} B",
+                      file=sys.stderr)
+
+    return dict(
+        meta=dict(time=time.strftime("%Y-%m-%dT%H:%M:%S"), python=platform.python_version(),
+                  numpy=np.__version__, platform=platform.platform()),
+        results=results,
+    )
+
+
+def compare(baseline, current, threshold=1.25):
+    """Names of the cases of `current` that took more than threshold times their `baseline` time."""
+
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["seconds"] / base["seconds"]
+        flag = "REGRESSION" if ratio > threshold else ""
+        print(f"{name:<56}{base['seconds']*1e6:>14.2f}{result['seconds']*1e6:>14.2f}{ratio:>8.2f}  {flag}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="JSON file for the results (default: stdout)")
+    run_parser.add_argument("-k", "--match", default="", help="only run cases whose name contains this")
+    run_parser.add_argument("--no-large", action="store_true", help="skip the 1e6 element cases")
+    compare_parser = commands.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=1.25,
+                                help="slowdown ratio flagged as a regression (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(SIZES[:-1] if args.no_large else SIZES, args.match)
+        text = json.dumps(results, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            print(text)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
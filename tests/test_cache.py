@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from asce7 import cache
+from asce7.cache import LRUCache, enable_scalar_cache, disable_scalar_cache, scalar_cache, scalar_cache_stats
+from asce7.common import Deg
+from asce7.v2016.chapter7 import fig7p4d1_Cs
+from asce7.v2016.chapter29 import eq29p4d6_GCrn_nom
+
+
+@pytest.fixture
+def scalar_cache_enabled():
+    enable_scalar_cache(maxsize=2, tolerance=1e-6)
+    yield
+    disable_scalar_cache()
+
+
+def test_lru_cache():
+    lru = LRUCache(maxsize=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+    assert "b" not in lru
+    assert lru.get("b") is None
+    assert lru.stats() == cache.CacheStats(hits=1, misses=1, evictions=1, size=2, maxsize=2)
+    lru.clear()
+    assert lru.stats() == cache.CacheStats(0, 0, 0, 0, 2)
+
+
+def test_scalar_cache(scalar_cache_enabled):
+    calls = []
+
+    @scalar_cache
+    def lookup(zone, area):
+        calls.append((zone, area))
+        return area * 2
+
+    assert lookup("1", 10.0) == 20.0
+    assert lookup("1", 10.0 + 1e-9) == 20.0
+    assert lookup("1", area=10.0) == 20.0
+    assert len(calls) == 2
+    lookup("2", 10.0)
+    lookup("3", 10.0)
+    stats = lookup.cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+
+def test_scalar_cache_arrays_bypass(scalar_cache_enabled):
+    result = fig7p4d1_Cs("other", np.array([Deg(20), Deg(40)]), 1.1)
+    assert result.shape == (2,)
+    assert fig7p4d1_Cs.cache.stats().size == 0
+
+
+def test_scalar_cache_disabled_by_default():
+    eq29p4d6_GCrn_nom("1", 10, 100)
+    assert scalar_cache_stats()["asce7.v2016.chapter29.eq29p4d6_GCrn_nom"].misses == 0
+
+
+def test_scalar_cache_lookups(scalar_cache_enabled):
+    first = eq29p4d6_GCrn_nom("1", 10, 100)
+    first += 5
+    assert eq29p4d6_GCrn_nom("1", 10.0, 100.0) == pytest.approx(0.79037466)
+    hit = eq29p4d6_GCrn_nom("1", 10.0, 100.0)
+    hit += 5
+    assert eq29p4d6_GCrn_nom("1", 10.0, 100.0) == pytest.approx(0.79037466)
+    assert eq29p4d6_GCrn_nom.filter
+    assert scalar_cache_stats()["asce7.v2016.chapter29.eq29p4d6_GCrn_nom"].hits == 3
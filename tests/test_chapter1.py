@@ -1,5 +1,6 @@
 import pytest
-from asce7.v2016.chapter1 import importance_factor
+import numpy as np
+from asce7.v2016.chapter1 import importance_factor, Risk, LoadType
 
 
 @pytest.mark.parametrize("load_type", [
@@ -7,3 +8,29 @@ from asce7.v2016.chapter1 import importance_factor
 ], indirect=True)
 def test_importance_factor(all_risk, load_type):
     assert importance_factor(all_risk, load_type)
+
+
+def test_importance_factor_array():
+    risk = np.array(["I", "II", "III", "IV", "II"])
+    load_type = [LoadType.snow, "S", "E", "Di", "Di"]
+    expected = [importance_factor(r, lt) for r, lt in zip(risk, load_type)]
+    np.testing.assert_array_equal(importance_factor(risk, load_type), expected)
+
+
+def test_importance_factor_array_codes():
+    result = importance_factor(np.array([0, 3]), 2)
+    np.testing.assert_array_equal(result, [1.00, 1.50])
+
+
+def test_importance_factor_array_mixed_labels_and_codes():
+    np.testing.assert_array_equal(importance_factor(["II", 1, Risk.IV], "S"), [1.0, 1.0, 1.2])
+
+
+def test_importance_factor_array_broadcast():
+    result = importance_factor([Risk.III], np.array(["S", "E"]))
+    np.testing.assert_array_equal(result, [1.10, 1.25])
+
+
+def test_importance_factor_array_unknown_label():
+    with pytest.raises(KeyError):
+        importance_factor(["II"], ["D"])
@@ -1,6 +1,8 @@
 import pytest
 import numpy as np
-from asce7.v2016.chapter2 import Strength, ASD
+import inspect
+from asce7.v2016.chapter2 import Strength, ASD, envelope, combinations, combination_load_types, envelope_stream, \
+    reduce_envelopes
 
 
 @pytest.mark.parametrize("D", [
@@ -23,3 +25,144 @@ def test_asd(D):
     W = 2
     result = a.wind_up_load(D, W)
     np.testing.assert_almost_equal(result, 0.6*D + 0.6*W)
+
+
+@pytest.fixture(scope="module")
+def loads():
+    rng = np.random.default_rng(0)
+    N, M = 4, 5
+    return {load_type: rng.uniform(-10, 20, (N, M)) for load_type in ("D", "L", "Lr", "S", "R", "W")}
+
+
+def _loop_envelope(cls, loads):
+    results = []
+    for index, (name, combination) in enumerate(combinations(cls)):
+        method = getattr(cls(), name)
+        kwargs = {k: v for k, v in loads.items() if k in inspect.signature(method).parameters}
+        results.extend((index, alternative, result)
+                       for alternative, result in enumerate(np.reshape(method(**kwargs), (-1, *loads["D"].shape))))
+    return results
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+def test_envelope(cls, loads):
+    result = envelope(cls, **loads)
+    looped = _loop_envelope(cls, loads)
+    stacked = np.stack([r for *_, r in looped])
+    np.testing.assert_allclose(result.max, stacked.max(axis=0))
+    np.testing.assert_allclose(result.min, stacked.min(axis=0))
+    rows = {(index, alternative): row for row, (index, alternative, _) in enumerate(looped)}
+    governing_row = np.vectorize(lambda i, a: rows[i, a])(result.max_combination, result.max_alternative)
+    np.testing.assert_allclose(np.take_along_axis(stacked, governing_row[None], axis=0)[0], result.max)
+
+
+def test_envelope_missing_loads_are_zero():
+    result = envelope(ASD, D=np.array([1.0, 2.0]))
+    np.testing.assert_allclose(result.max, [1.0, 2.0])
+    np.testing.assert_allclose(result.min, [0.6, 1.2])
+    np.testing.assert_array_equal(result.min_combination, [6, 6])
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+def test_combination_load_types(cls):
+    for _, combination in combinations(cls):
+        load_types = combination_load_types(combination)
+        for column, load_type in enumerate(load_types):
+            unit_load = {other: float(other == load_type) for other in load_types}
+            np.testing.assert_allclose(np.ravel(combination(**unit_load)), combination.matrix[:, column])
+
+
+def test_envelope_unknown_load_type():
+    with pytest.raises(TypeError):
+        envelope(Strength, E=1.0)
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+def test_compiled(cls, loads):
+    compiled = cls.compiled
+    assert compiled is cls().compiled
+    assert compiled.coefficients.shape == (len(compiled.combination_index), len(compiled.load_types))
+    assert not compiled.coefficients.flags.writeable
+    results = compiled.evaluate(**loads)
+    looped = np.stack([r for *_, r in _loop_envelope(cls, loads)])
+    np.testing.assert_allclose(results, looped)
+
+
+def test_compiled_coefficients():
+    compiled = ASD.compiled
+    row = (compiled.combination_index == 5) & (compiled.alternative_index == 1)
+    np.testing.assert_allclose(compiled.coefficients[row], [[1.0, 0.75, 0.0, 0.75, 0.0, 0.45]])
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+@pytest.mark.parametrize("W_sign", [1, 0])
+def test_prune(cls, W_sign, loads):
+    signs = dict.fromkeys(("D", "L", "Lr", "S", "R"), 1)
+    signs["W"] = W_sign
+    signed_loads = {k: np.abs(v) if signs[k] else v for k, v in loads.items()}
+    full = envelope(cls, **signed_loads)
+    pruned = envelope(cls, signs=signs, **signed_loads)
+    np.testing.assert_array_equal(pruned.max, full.max)
+    np.testing.assert_array_equal(pruned.min, full.min)
+
+
+def test_prune_removed():
+    pruned = ASD.compiled.prune(dict(D=1, L=1, Lr=1, S=1, R=1, W=1))
+    assert pruned.removed == (("live_primary_load", 0), ("live_primary_load", 1), ("live_primary_load", 2))
+    assert len(pruned.coefficients) == len(ASD.compiled.coefficients) - 3
+    assert not np.isin(3, pruned.combination_index)
+    assert pruned is ASD.compiled.prune(dict(D=1, L=1, Lr=1, S=1, R=1, W=1))
+
+
+def test_prune_unconstrained_keeps_everything():
+    assert Strength.compiled.prune({}).removed == ()
+
+
+def test_prune_bad_sign():
+    with pytest.raises(ValueError):
+        ASD.compiled.prune(dict(D=2))
+
+
+def _chunks(loads, size):
+    n = len(loads["D"])
+    for start in range(0, n, size):
+        yield {k: v[start:start + size] for k, v in loads.items()}
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+def test_envelope_stream(cls, loads):
+    full = envelope(cls, **loads)
+    chunked = list(envelope_stream(cls, _chunks(loads, 3)))
+    assert len(chunked) == 2
+    for field in full._fields:
+        np.testing.assert_array_equal(np.concatenate([getattr(env, field) for env in chunked]), getattr(full, field))
+
+
+def test_envelope_stream_structured_array(loads):
+    structured = np.empty(loads["D"].shape[0], dtype=[("member", int)] + [(k, float, 5) for k in loads])
+    for k, v in loads.items():
+        structured[k] = v
+    (result,) = envelope_stream(ASD, [structured])
+    np.testing.assert_array_equal(result.max, envelope(ASD, **loads).max)
+
+
+def test_envelope_stream_unknown_load_type():
+    with pytest.raises(TypeError):
+        next(envelope_stream(ASD, [dict(D=1.0, w=5.0)]))
+
+
+@pytest.mark.parametrize("cls", [Strength, ASD])
+def test_reduce_envelopes(cls, loads):
+    full = envelope(cls, **loads)
+    result = reduce_envelopes(envelope_stream(cls, _chunks(loads, 3)))
+    np.testing.assert_array_equal(result.max, full.max.max(axis=0))
+    np.testing.assert_array_equal(result.min, full.min.min(axis=0))
+    np.testing.assert_array_equal(result.max_case, full.max.argmax(axis=0))
+    np.testing.assert_array_equal(result.min_case, full.min.argmin(axis=0))
+    np.testing.assert_array_equal(result.max_combination,
+                                  np.take_along_axis(full.max_combination, result.max_case[None], axis=0)[0])
+
+
+def test_reduce_envelopes_empty():
+    with pytest.raises(ValueError):
+        reduce_envelopes([])
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from asce7.v2016.chapter26 import eq26p10d1_Kz, eq26p10d1_qz, eq26p10d1_Ke, velocity_pressure, site_profile, \
+    SiteProfile, SITE_PROFILES
+
+
+# Table 26.10-1 Velocity Pressure Exposure Coefficients, Kh and Kz
+@pytest.mark.parametrize("z, exposure, Kz", [
+    (0, "B", 0.57),
+    (15, "B", 0.57),
+    (30, "B", 0.70),
+    (100, "B", 0.99),
+    (15, "C", 0.85),
+    (60, "C", 1.13),
+    (15, "D", 1.03),
+    (500, "D", 1.89),
+])
+def test_eq26p10d1_Kz(z, exposure, Kz):
+    assert eq26p10d1_Kz(z, exposure) == pytest.approx(Kz, abs=0.01)
+
+
+def test_eq26p10d1_Kz_array():
+    z = np.array([[10], [40], [2000]])
+    exposure = np.array(["B", "C", "D"])
+    result = eq26p10d1_Kz(z, exposure)
+    assert result.shape == (3, 3)
+    np.testing.assert_allclose(result[:, 1], [eq26p10d1_Kz(v, "C") for v in (10, 40, 2000)])
+    np.testing.assert_allclose(result[2], 2.01)
+
+
+def test_velocity_pressure():
+    floors = np.arange(10, 110, 10)[:, None]
+    exposure = np.array(["B", "C"])
+    V = np.array([115, 140])
+    result = velocity_pressure(floors, exposure, V, Kd=0.85, Kzt=1.0, ground_elevation=np.array([0, 3000]))
+    assert result.shape == (10, 2)
+    expected = eq26p10d1_qz(eq26p10d1_Kz(40, "C"), 1.0, 0.85, eq26p10d1_Ke(3000), 140)
+    assert result[3, 1] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("exposure", ["B", "C", "D"])
+def test_site_profile(exposure):
+    profile = site_profile(exposure, 120, 0.85, 1.1, 500)
+    z = np.array([0, 15, 22.5, 100, 333, 650, 5000])
+    np.testing.assert_allclose(profile(z), profile.exact(z), rtol=1e-12)
+    np.testing.assert_allclose(profile.exact(z), velocity_pressure(z, exposure, 120, 0.85, 1.1, 500))
+
+
+def test_site_profile_custom_grid():
+    profile = SiteProfile("C", 115, 0.85, heights=[30, 60, 120])
+    z = np.array([0, 20, 30, 45, 120, 500])
+    np.testing.assert_allclose(profile(z), profile.exact(z), rtol=1e-12)
+    assert profile(20) == pytest.approx(profile.exact(20))
+
+
+def test_site_profile_cached():
+    SITE_PROFILES.clear()
+    profile = site_profile("C", 115, 0.85)
+    assert site_profile(1, 115.0, 0.85, 1.0, 0) is profile
+    assert site_profile("C", 120, 0.85) is not profile
+    assert SITE_PROFILES.stats().hits == 1
@@ -1,5 +1,8 @@
+import subprocess
+import sys
 import pytest
-from asce7.common import Log
+from asce7.common import Log, DegArray, evaluate_filtered
+from asce7.v2016.chapter29 import eq29p4d6_GCrn_nom, filter29p4p3, filter29p4p4
 from ceng.interp import interp1d_twice
 import numpy as np
 
@@ -44,3 +47,70 @@ def test_FIG29P4D7_GCrn_nom_Zone_1(FIG29P4D7_GCrn_nom_Zone_1_interpolations_xyz,
     x, y, expected = FIG29P4D7_GCrn_nom_Zone_1_interpolations_xyz
     result = interp1d_twice_with_2d_z_FIG29P4D7_GCrn_nom_Zone_1(x, y)
     np.testing.assert_array_almost_equal(result, expected, decimal=16)
+
+
+def test_interpolants_deferred():
+    code = ("import sys; import asce7.v2016.chapter29 as ch29; assert 'scipy' not in sys.modules; "
+            "ch29.eq29p4d7_γa(10); assert ch29.FIG29P4D8_γa_INTERPOLANT is ch29.fig29p4d8_γa_interpolant()")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_eq29p4d6_GCrn_nom():
+    assert eq29p4d6_GCrn_nom("2", 15, 500) == pytest.approx(0.65)
+
+
+def test_eq29p4d6_GCrn_nom_grid():
+    rng = np.random.default_rng(0)
+    zone = rng.choice(["1", "2", "3"], 50)
+    tilt = rng.uniform(0, 35, 50)
+    area = 10 ** rng.uniform(0, np.log10(5000), 50)
+    expected = [eq29p4d6_GCrn_nom(*args) for args in zip(zone, tilt, area)]
+    np.testing.assert_allclose(eq29p4d6_GCrn_nom(zone, tilt, area), expected, rtol=1e-12)
+
+
+def test_eq29p4d6_GCrn_nom_grid_zone_numbers():
+    result = eq29p4d6_GCrn_nom(np.array([1, 2.2, 3]), np.array([0, 15, 35]), np.array([1, 500, 5000]))
+    np.testing.assert_allclose(result, [1.5, 0.65, 0.50])
+
+
+def test_eq29p4d6_GCrn_nom_grid_out_of_range():
+    with pytest.raises(ValueError):
+        eq29p4d6_GCrn_nom(["1"], [40], [10])
+    with pytest.raises(ValueError):
+        eq29p4d6_GCrn_nom([4], [10], [10])
+
+
+def test_filters_accept_angle_arrays():
+    θ, ω = DegArray([3, 10, 5]), DegArray([20, 20, 40])
+    np.testing.assert_array_equal(filter29p4p3(θ, "flat", 5, ω, 1, 2), [True, False, False])
+    np.testing.assert_array_equal(filter29p4p4(θ, "hip", 5, DegArray([1, 1, 1]), 0.5), [True, False, True])
+
+
+@pytest.fixture
+def panels():
+    return dict(
+        θ=DegArray([3, 10, 5, 2]),
+        roof_type=np.array(["flat", "flat", "gable", "shed"]),
+        Lp=5,
+        ω=DegArray([20, 20, 30, 20]),
+        h1=1,
+        h2=np.array([2, 2, 3, 2]),
+        zone=np.array(["1", "2", "3", "1"]),
+        tilt=np.array([10, 20, 30, 40]),
+        area=np.array([10, 100, 1000, 100]),
+    )
+
+
+def test_evaluate_filtered(panels):
+    result, mask = evaluate_filtered(eq29p4d6_GCrn_nom, **panels)
+    np.testing.assert_array_equal(mask, [True, False, True, False])
+    np.testing.assert_array_equal(np.isnan(result), ~mask)
+    # the last panel's tilt is outside Figure 29.4-7, but it is filtered out before the lookup
+    np.testing.assert_allclose(result[mask], eq29p4d6_GCrn_nom(panels["zone"][mask], panels["tilt"][mask],
+                                                               panels["area"][mask]))
+
+
+def test_evaluate_filtered_missing_input(panels):
+    del panels["h1"]
+    with pytest.raises(TypeError, match="h1"):
+        evaluate_filtered(eq29p4d6_GCrn_nom, **panels)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from asce7.v2016.chapter30 import fig30p3d2A_GCp, eq30p3d1_GCp_interpolant, fig30p3d2A_zone_check, \
+    FIG30P3D2A_GCp_ROOF_NS
+
+
+@pytest.mark.parametrize("zone, A, GCp", [
+    ("1'", 1, (0.3, -0.9)),
+    ("1'", 100, (0.2, -0.9)),
+    ("1'", 1000, (0.2, -0.4)),
+    ("1", 10, (0.3, -1.7)),
+    ("2", 500, (0.2, -1.4)),
+    ("3", 0.5, (0.3, -3.2)),
+    ("3", 5000, (0.2, -1.4)),
+    ("3", 10 ** 1.5, (0.25, -3.2 + 1.8 * 0.5 / np.log10(50))),
+])
+def test_fig30p3d2A_GCp(zone, A, GCp):
+    assert fig30p3d2A_GCp("roof", zone, A) == pytest.approx(GCp)
+
+
+def test_fig30p3d2A_GCp_schedule():
+    rng = np.random.default_rng(0)
+    zone = rng.choice(["1'", "1", "2", "3"], 30)
+    A = 10 ** rng.uniform(0, 3.5, 30)
+    positive, negative = eq30p3d1_GCp_interpolant("gable")(np.full(30, "roof"), zone, A)
+    expected = np.array([fig30p3d2A_GCp("roof", z, a) for z, a in zip(zone, A)])
+    np.testing.assert_allclose(positive, expected[:, 0])
+    np.testing.assert_allclose(negative, expected[:, 1])
+
+
+def test_fig30p3d2A_GCp_zone_codes():
+    positive, negative = fig30p3d2A_GCp("roof", np.array([0, 1, 2, 3]), 10)
+    np.testing.assert_allclose(positive, 0.3)
+    np.testing.assert_allclose(negative, [-0.9, -1.7, -2.1, -3.2])
+
+
+@pytest.mark.parametrize("d1, d2, zone", [
+    (1, 1, "3"),
+    (2, 6, "3"),
+    (6, 2, "3"),
+    (2, 7, "2"),
+    (5, 5, "2"),
+    (6, 50, "2"),
+    (7, 50, "1"),
+    (12, 12, "1"),
+    (13, 50, "1'"),
+])
+def test_fig30p3d2A_zone_check(d1, d2, zone):
+    assert fig30p3d2A_zone_check(d1, d2, 10) == FIG30P3D2A_GCp_ROOF_NS.zone.index(zone)
+
+
+def test_fig30p3d2A_zone_check_roof_mesh():
+    x, y = np.meshgrid(np.linspace(0, 100, 101), np.linspace(0, 60, 61))
+    d1, d2 = np.minimum(x, 100 - x), np.minimum(y, 60 - y)
+    zones = fig30p3d2A_zone_check(d1, d2, 15)
+    assert zones.shape == x.shape
+    assert set(np.unique(zones)) == {0, 1, 2, 3}
+    positive, negative = fig30p3d2A_GCp("roof", zones, 20)
+    assert negative[30, 50] == pytest.approx(fig30p3d2A_GCp("roof", "1'", 20)[1])
+    assert negative[0, 0] == pytest.approx(fig30p3d2A_GCp("roof", "3", 20)[1])
@@ -1,5 +1,9 @@
-from asce7.common import Deg, SlopeIn12
-from asce7.v2016.chapter7 import fig7p4d1_Cs
+import subprocess
+import sys
+from asce7.common import Deg, SlopeIn12, SlopeIn12Array
+from asce7.v2016.chapter1 import importance_factor
+from asce7.v2016.chapter7 import fig7p4d1_Cs, table7p3d1_Ce, table7p3d2_Ct, TABLE7P3D2_Ct_NS, snow_loads, eq7p3d1_pf, \
+    eq7p3p4d1_pm, eq7p4d1_ps, eq7p10d1_R
 from ceng.interp import interp1d_twice
 import numpy as np
 import pytest
@@ -61,3 +65,116 @@ def test_FIG7P4D1_Cs(FIG7P4D1_Cs_interpolations_xyz, interp1d_twice_with_2d_x_FI
     x, y, expected = FIG7P4D1_Cs_interpolations_xyz
     result = interp1d_twice_with_2d_x_FIG7P4D1_Cs(x, y)
     np.testing.assert_array_equal(result, expected)
+
+
+def test_interpolants_deferred():
+    code = ("import sys; import asce7.v2016.chapter7 as ch7; assert 'scipy' not in sys.modules; "
+            "ch7.warmup(); assert 'scipy' in sys.modules; assert ch7.FIG7P4D1_Cs_DICT is ch7.fig7p4d1_Cs_dict()")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_table7p3d1_Ce_array():
+    roughness = np.array(["B", "Windswept mountainous above tree line", "D", "C"])
+    exposure = np.array(["sheltered", "sheltered", "fully", "partially"])
+    np.testing.assert_array_equal(table7p3d1_Ce(roughness, exposure), [1.2, np.nan, 0.8, 1.0])
+
+
+def test_table7p3d1_Ce_codes():
+    result = table7p3d1_Ce(np.array([[0], [4]]), np.array([0, 1, 2]))
+    np.testing.assert_array_equal(result, [[0.9, 1.0, 1.2], [0.7, 0.8, np.nan]])
+
+
+def test_table7p3d2_Ct_array():
+    thermal_condition = ["Freezer building", "Unheated and open air structures"]
+    np.testing.assert_array_equal(table7p3d2_Ct(thermal_condition), [1.3, 1.2])
+    np.testing.assert_array_equal(table7p3d2_Ct(np.array([4, 0])), [0.85, 1.0])
+
+
+@pytest.fixture(scope="module")
+def buildings():
+    n = 40
+    rng = np.random.default_rng(0)
+    return dict(
+        risk=rng.choice(["I", "II", "III", "IV"], n),
+        pg=rng.uniform(0, 60, n),
+        wind_surface_roughness=rng.choice(["B", "C", "D"], n),
+        snow_exposure=rng.choice(["fully", "partially", "sheltered"], n),
+        thermal_condition=rng.choice(TABLE7P3D2_Ct_NS.thermal_condition[:3], n),
+        surface_type=rng.choice(["slippery", "other"], n),
+        roof_slope=np.radians(rng.uniform(0, 60, n)),
+        W=rng.uniform(10, 200, n),
+        roof_type=rng.choice(["gable", "curved"], n),
+    )
+
+
+def test_snow_loads(buildings):
+    result = snow_loads(buildings)
+    for i in range(len(buildings["pg"])):
+        b = {k: v[i] for k, v in buildings.items()}
+        Is = importance_factor(b["risk"], "S")
+        Ct = table7p3d2_Ct(b["thermal_condition"])
+        pf = eq7p3d1_pf(table7p3d1_Ce(b["wind_surface_roughness"], b["snow_exposure"]), Ct, Is, b["pg"])
+        pm = eq7p3p4d1_pm(b["roof_type"], b["roof_slope"], Is, b["pg"])
+        Cs = fig7p4d1_Cs(b["surface_type"], b["roof_slope"], Ct)
+        ps = eq7p4d1_ps(Cs, pf)
+        R = eq7p10d1_R(b["pg"], np.degrees(b["roof_slope"]), b["W"])
+        expected = (pf, pm, Cs, ps, R, max(ps + R, pm))
+        np.testing.assert_allclose([arr[i] for arr in result], expected, rtol=1e-12)
+
+
+def test_snow_loads_roof_type_list():
+    buildings = dict(risk="II", pg=20.0, wind_surface_roughness="C", snow_exposure="fully",
+                     thermal_condition="Freezer building", surface_type="other", roof_slope=np.radians(12.0), W=50.0,
+                     roof_type=["curved", "gable"])
+    np.testing.assert_array_equal(snow_loads(buildings).pm, [0, 20])
+
+
+def test_eq7p10d1_R():
+    np.testing.assert_array_equal(eq7p10d1_R(np.array([10, 30, 10, 0]), np.array([0.5, 0.5, 2.0, 0.5]), 50),
+                                  [5, 0, 0, 0])
+
+
+def test_snow_loads_structured_array(buildings):
+    dtype = [(k, v.dtype) for k, v in buildings.items() if k != "roof_type"]
+    structured = np.empty(len(buildings["pg"]), dtype=dtype)
+    for k, _ in dtype:
+        structured[k] = buildings[k]
+    result = snow_loads(structured)
+    expected = snow_loads({k: v for k, v in buildings.items() if k != "roof_type"})
+    for arr, expected_arr in zip(result, expected):
+        np.testing.assert_array_equal(arr, expected_arr)
+
+
+def test_snow_loads_Ct_outside_figure():
+    freezer = dict(risk="II", pg=30.0, wind_surface_roughness=["C"], snow_exposure=["fully"],
+                   thermal_condition=["Freezer building"], surface_type=["other"], roof_slope=Deg(50), W=50.0)
+    cold = dict(freezer, thermal_condition=["Unheated and open air structures"])
+    assert snow_loads(freezer).Cs == snow_loads(cold).Cs
+
+
+def test_fig7p4d1_Cs_mixed_surface_types():
+    surface_type = np.array(["slippery", "other", "other", "slippery", "other"])
+    roof_slope = np.radians([20, 20, 40, 60, 80])
+    temp_coefficient = np.array([1.0, 1.05, 1.1, 1.2, 1.15])
+    expected = [fig7p4d1_Cs(*args) for args in zip(surface_type, roof_slope, temp_coefficient)]
+    np.testing.assert_allclose(fig7p4d1_Cs(surface_type, roof_slope, temp_coefficient), expected, rtol=1e-12)
+
+
+def test_fig7p4d1_Cs_codes_broadcast():
+    result = fig7p4d1_Cs(np.array([[0], [1]]), Deg(20), np.array([1.0, 1.2]))
+    assert result.shape == (2, 2)
+    assert result[0, 0] == pytest.approx(fig7p4d1_Cs("slippery", Deg(20), 1.0))
+    assert result[1, 1] == pytest.approx(fig7p4d1_Cs("other", Deg(20), 1.2))
+
+
+def test_fig7p4d1_Cs_array_out_of_range():
+    with pytest.raises(ValueError):
+        fig7p4d1_Cs(["other"], [Deg(20)], [1.3])
+
+
+def test_angle_arrays_accepted():
+    roof_slope = SlopeIn12Array([1, 4, 12])
+    expected_pm = [eq7p3p4d1_pm("gable", SlopeIn12(v), 1.0, 30) for v in (1, 4, 12)]
+    np.testing.assert_array_equal(eq7p3p4d1_pm("gable", roof_slope, 1.0, 30), expected_pm)
+    expected_Cs = [fig7p4d1_Cs("slippery", SlopeIn12(v), 1.0) for v in (1, 4, 12)]
+    np.testing.assert_allclose(fig7p4d1_Cs("slippery", roof_slope, 1.0), expected_Cs)
@@ -0,0 +1,103 @@
+import threading
+import time
+import numpy as np
+import pytest
+from asce7.common import build_once, label_codes, Deg, DegArray, SlopeIn12, SlopeIn12Array, attach_filter, \
+    evaluate_filtered, lazy_attributes, _AngleArray
+
+
+def test_label_codes():
+    result = label_codes(np.array([["b", "a"], ["c", "b"]]), ("a", "b", "c"))
+    np.testing.assert_array_equal(result, [[1, 0], [2, 1]])
+
+
+def test_label_codes_mixed():
+    np.testing.assert_array_equal(label_codes(["b", 0, "c", 0, "b"], ("a", "b", "c")), [1, 0, 2, 0, 1])
+
+
+def test_label_codes_unknown_label():
+    with pytest.raises(KeyError):
+        label_codes(np.array(["a", "d"]), ("a", "b", "c"))
+    with pytest.raises(KeyError):
+        label_codes(["a", "d"], ("a", "b", "c"))
+
+
+def test_label_codes_enum_members():
+    from asce7.v2016.chapter1 import Risk
+    np.testing.assert_array_equal(label_codes([Risk.IV, "I", 1], Risk), [3, 0, 1])
+    np.testing.assert_array_equal(label_codes(np.array(["IV", "I"]), Risk), [3, 0])
+    assert label_codes("III", Risk) == 2
+
+
+def test_label_codes_out_of_range():
+    with pytest.raises(IndexError):
+        label_codes([3], ("a", "b", "c"))
+
+
+def test_build_once_threads():
+    calls = []
+
+    @build_once
+    def builder():
+        calls.append(None)
+        time.sleep(0.01)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(builder())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.parametrize("array_type, scalar_type", [(DegArray, Deg), (SlopeIn12Array, SlopeIn12)])
+def test_angle_array(array_type, scalar_type):
+    values = [0.0, 3.0, 4.5, 12.0]
+    angles = array_type(values)
+    np.testing.assert_array_equal(angles, [scalar_type(v) for v in values])
+    assert angles.value is not None
+    np.testing.assert_array_equal(angles.units, values)
+    np.testing.assert_allclose(angles[1:].units, values[1:])
+    assert repr(array_type([3.0])) == f"{array_type.__name__}([3.])"
+
+
+def test_lazy_attributes():
+    built = []
+    TABLE = build_once(lambda: built.append(1) or "table")
+    warmup, __getattr__ = lazy_attributes("chapter", dict(TABLE=TABLE))
+    assert __getattr__("TABLE") == "table"
+    warmup()
+    assert built == [1]
+    with pytest.raises(AttributeError, match="module 'chapter' has no attribute 'OTHER'"):
+        __getattr__("OTHER")
+
+
+def test_angle_array_requires_conversions():
+    with pytest.raises(TypeError):
+        _AngleArray([1.0])
+    with pytest.raises(TypeError):
+        class GradArray(_AngleArray, to_radians=lambda value: value * np.pi/200):
+            pass
+
+
+def test_angle_array_results_are_plain_arrays():
+    angles = DegArray([5, 10])
+    assert type(angles <= Deg(7)) is np.ndarray
+    assert type(np.sin(angles)) is np.ndarray
+    assert type(angles.sum()) is np.float64
+
+
+def test_evaluate_filtered_skips_rows():
+    evaluated = []
+
+    @attach_filter(lambda x: x > 0)
+    def func(x, y):
+        evaluated.append(x)
+        return x * y
+
+    result, mask = evaluate_filtered(func, x=np.array([-1.0, 2.0, 3.0]), y=2.0)
+    np.testing.assert_array_equal(result, [np.nan, 4.0, 6.0])
+    np.testing.assert_array_equal(evaluated[0], [2.0, 3.0])
@@ -0,0 +1,66 @@
+import functools
+import numpy as np
+import pytest
+from asce7.exceptions import ASCE7Error
+from asce7.graph import Graph, output_name
+from asce7.v2016 import chapter7 as ch7
+from asce7.v2016 import chapter29 as ch29
+
+SOLAR_FUNCTIONS = [ch29.eq29p4d5_p, ch29.eq29p4d6_GCrn, ch29.eq29p4d6_γp, ch29.eq29p4d6_γc, ch29.eq29p4d6_γE,
+                   ch29.eq29p4d6_GCrn_nom]
+SOLAR_INPUTS = dict(qh=30.0, hpt=2.0, h=40.0, Lp=5.0, exposure_condition="exposed", zone=np.array(["1", "2"]),
+                    tilt=np.array([10.0, 20.0]), area=np.array([50.0, 200.0]))
+
+
+@pytest.mark.parametrize("func, name", [
+    (ch7.eq7p3p4d1_pm, "pm"),
+    (ch7.table7p3d1_Ce, "Ce"),
+    (ch29.eq29p4d6_GCrn_nom, "GCrn_nom"),
+    (ch29.eq29p4d6_γE, "γE"),
+])
+def test_output_name(func, name):
+    assert output_name(func) == name
+
+
+def test_order():
+    graph = Graph(SOLAR_FUNCTIONS)
+    assert graph.order("p", SOLAR_INPUTS) == ("γp", "γc", "γE", "GCrn_nom", "GCrn", "p")
+    assert graph.order("GCrn", dict(SOLAR_INPUTS, GCrn_nom=1.0)) == ("γp", "γc", "γE", "GCrn")
+
+
+def test_evaluate():
+    result = Graph(SOLAR_FUNCTIONS).evaluate("p", **SOLAR_INPUTS)
+    γp = ch29.eq29p4d6_γp(2.0, 40.0)
+    γc = ch29.eq29p4d6_γc(5.0)
+    GCrn_nom = ch29.eq29p4d6_GCrn_nom(SOLAR_INPUTS["zone"], SOLAR_INPUTS["tilt"], SOLAR_INPUTS["area"])
+    np.testing.assert_allclose(result, 30.0 * ch29.eq29p4d6_GCrn(γp, γc, 1.5, GCrn_nom))
+
+
+def test_evaluate_shared_intermediates_once():
+    calls = []
+
+    def counted(func):
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            calls.append(func.__name__)
+            return func(**kwargs)
+        return wrapper
+
+    graph = Graph({output_name(func): counted(func) for func in [
+        ch7.table7p3d1_Ce, ch7.table7p3d2_Ct, ch7.eq7p3d1_pf, ch7.fig7p4d1_Cs, ch7.eq7p4d1_ps]})
+    result = graph.evaluate(["pf", "ps"], wind_surface_roughness="B", snow_exposure="fully",
+                            thermal_condition="Unheated and open air structures", Is=1.0, pg=30.0,
+                            surface_type="other", roof_slope=ch7.Deg(45), temp_coefficient=1.2)
+    assert result["pf"] == pytest.approx(0.9 * 1.2 * 30)
+    assert result["ps"] == pytest.approx(result["pf"])
+    assert sorted(calls) == sorted(["table7p3d1_Ce", "table7p3d2_Ct", "eq7p3d1_pf", "fig7p4d1_Cs", "eq7p4d1_ps"])
+
+
+def test_conflicting_outputs():
+    with pytest.raises(ASCE7Error, match="mapping"):
+        Graph([ch29.eq29p4d5_p, ch29.eq29p4d7_p])
+
+
+def test_missing_input():
+    with pytest.raises(ASCE7Error, match="hpt"):
+        Graph(SOLAR_FUNCTIONS).order("p", {k: v for k, v in SOLAR_INPUTS.items() if k != "hpt"})
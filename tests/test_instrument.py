@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import numpy as np
+from asce7.instrument import Profiler
+from asce7.v2016 import chapter1, chapter2, chapter7
+
+
+def test_profiler_restores_functions():
+    fig7p4d1_Cs, dead_load = chapter7.fig7p4d1_Cs, chapter2.Strength.__dict__["dead_load"]
+    importance_factor = chapter1.importance_factor
+    with Profiler(memory=False) as profiler:
+        assert chapter7.fig7p4d1_Cs is not fig7p4d1_Cs
+        assert chapter7.importance_factor is chapter1.importance_factor is not importance_factor
+    assert not profiler.enabled
+    assert chapter7.fig7p4d1_Cs is fig7p4d1_Cs
+    assert chapter2.Strength.__dict__["dead_load"] is dead_load
+    assert chapter7.importance_factor is chapter1.importance_factor is importance_factor
+
+
+def test_profiler_report():
+    events = []
+    with Profiler(callback=events.append) as profiler:
+        Cs = chapter7.fig7p4d1_Cs("other", np.radians([10.0, 40.0, 60.0]), 1.1)
+        assert chapter2.Strength().dead_load(D=2.0) == 2.8
+        chapter7.fig7p4d1_Cs("other", chapter7.Deg(40), 1.1)
+    np.testing.assert_array_equal(Cs, chapter7.fig7p4d1_Cs("other", np.radians([10.0, 40.0, 60.0]), 1.1))
+
+    report = profiler.report()
+    Cs_stats = report["asce7.v2016.chapter7.fig7p4d1_Cs"]
+    assert Cs_stats.calls == 2
+    assert Cs_stats.elements == 4
+    assert Cs_stats.max_elements == 3
+    assert Cs_stats.seconds > 0
+    assert Cs_stats.max_allocated > 0
+    assert report["asce7.v2016.chapter2.Strength.dead_load"].calls == 1
+    assert [event.name for event in events].count("asce7.v2016.chapter7.fig7p4d1_Cs") == 2
+    assert "fig7p4d1_Cs" in profiler.format_report()
+
+
+def test_profiler_nested_calls():
+    buildings = dict(risk="II", pg=30.0, wind_surface_roughness=["B", "C"], snow_exposure="fully",
+                     thermal_condition=chapter7.TABLE7P3D2_Ct_NS.thermal_condition[0], surface_type="other",
+                     roof_slope=np.radians([5.0, 30.0]), W=50.0)
+    with Profiler() as profiler:
+        chapter7.snow_loads(buildings)
+    report = profiler.report()
+    outer, inner = report["asce7.v2016.chapter7.snow_loads"], report["asce7.v2016.chapter7.fig7p4d1_Cs"]
+    assert outer.elements == inner.elements == 2
+    assert outer.seconds >= inner.seconds
+    assert outer.max_allocated >= inner.max_allocated
+    assert report["asce7.v2016.chapter1.importance_factor"].calls == 1
+
+
+def test_profiler_memory_in_enabling_thread_only():
+    events = []
+    with Profiler(callback=events.append):
+        thread = threading.Thread(target=chapter7.table7p3d2_Ct, args=(["Freezer building"] * 3,))
+        thread.start()
+        thread.join()
+        chapter7.table7p3d2_Ct(["Freezer building"] * 2)
+    other, enabling = events
+    assert other.elements == 3 and other.allocated is None
+    assert enabling.elements == 2 and enabling.allocated is not None
+
+
+def test_profile_environment_variable(tmp_path):
+    path = tmp_path / "profile.json"
+    code = "from asce7.v2016 import chapter29; chapter29.eq29p4d7_γa(100.0)"
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "ASCE7_PROFILE": str(path)})
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["asce7.v2016.chapter29.eq29p4d7_γa"]["calls"] == 1
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from asce7.parallel import ChunkedExecutor, run_portfolio
+from asce7.v2016 import chapter7, chapter26
+from asce7.v2016.chapter1 import Risk
+
+ROWS = 5000
+
+
+@pytest.fixture
+def buildings():
+    rng = np.random.default_rng(0)
+    return dict(
+        risk=rng.choice(["I", "II", "III", "IV"], ROWS),
+        pg=rng.uniform(0, 60, ROWS),
+        wind_surface_roughness=rng.choice(["B", "C", "D"], ROWS),
+        snow_exposure=rng.choice(["fully", "partially", "sheltered"], ROWS),
+        thermal_condition=rng.choice(chapter7.TABLE7P3D2_Ct_NS.thermal_condition, ROWS),
+        surface_type=rng.choice(["slippery", "other"], ROWS),
+        roof_slope=np.radians(rng.uniform(0, 60, ROWS)),
+        W=50.0,
+    )
+
+
+def test_run_portfolio_snow(buildings):
+    expected = chapter7.snow_loads(buildings)
+    result = run_portfolio("snow", buildings, workers=2, shard_rows=1000)
+    assert type(result) is chapter7.SnowLoads
+    for actual, single in zip(result, expected):
+        assert actual.dtype == single.dtype
+        np.testing.assert_array_equal(actual, single)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_portfolio_enum_and_mixed_label_columns(buildings, workers):
+    rng = np.random.default_rng(3)
+    columns = dict(buildings,
+                   risk=[list(Risk)[i] for i in rng.integers(0, 4, ROWS)],
+                   wind_surface_roughness=[label if i % 2 else int(code) for i, (label, code) in
+                                           enumerate(zip(rng.choice(["B", "C", "D"], ROWS), rng.integers(0, 3, ROWS)))],
+                   roof_type=["curved", "gable"] * (ROWS // 2))
+    expected = chapter7.snow_loads(columns)
+    result = run_portfolio("snow", columns, workers=workers, shard_rows=1000)
+    for actual, single in zip(result, expected):
+        assert actual.dtype == single.dtype
+        np.testing.assert_array_equal(actual, single)
+
+
+def test_run_portfolio_wind():
+    rng = np.random.default_rng(1)
+    columns = dict(z=rng.uniform(0, 600, ROWS), exposure=list(rng.choice(["B", "C", "D"], ROWS)),
+                   V=rng.uniform(90, 180, ROWS), Kd=0.85)
+    result = run_portfolio("wind", columns, workers=2, shard_rows=1000)
+    expected = chapter26.velocity_pressure(**columns)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+    single = run_portfolio("wind", columns, workers=1)
+    assert single.dtype == result.dtype
+    np.testing.assert_array_equal(single, result)
+
+
+def test_run_portfolio_structured_array(buildings):
+    table = np.zeros(ROWS, dtype=[(name, np.asarray(column).dtype) for name, column in buildings.items()])
+    for name, column in buildings.items():
+        table[name] = column
+    result = run_portfolio("snow", table, workers=2)
+    for actual, single in zip(result, run_portfolio("snow", table, workers=1)):
+        assert actual.dtype == single.dtype
+        np.testing.assert_array_equal(actual, single)
+
+
+def test_run_portfolio_errors(buildings):
+    with pytest.raises(ValueError):
+        run_portfolio("seismic", buildings)
+    with pytest.raises(TypeError):
+        run_portfolio("snow", dict(buildings, V=115.0))
+
+
+def test_chunked_executor():
+    rng = np.random.default_rng(2)
+    Kz, V = rng.uniform(0.5, 2.0, 10_000), rng.uniform(90, 180, 10_000)
+    with ChunkedExecutor(workers=3, threshold=1000, chunk_size=1000) as executor:
+        assert executor.chunk_size == 1024
+        np.testing.assert_array_equal(executor(chapter26.eq26p10d1_qz, Kz, 1.0, 0.85, 1.0, V=V),
+                                      chapter26.eq26p10d1_qz(Kz, 1.0, 0.85, 1.0, V))
+        z, exposure = rng.uniform(0, 600, (40, 100)), rng.choice(["B", "C", "D"], 100)
+        np.testing.assert_array_equal(executor.wrap(chapter26.velocity_pressure)(z, exposure, 115, 0.85),
+                                      chapter26.velocity_pressure(z, exposure, 115, 0.85))
+        scalars = (1.0, 1.0, 0.85, 1.0, 115)
+        assert executor(chapter26.eq26p10d1_qz, *scalars) == chapter26.eq26p10d1_qz(*scalars)
+
+
+def test_chunked_executor_does_not_copy_arguments():
+    rng = np.random.default_rng(4)
+    z, exposure = rng.uniform(0, 600, (3000, 1)), rng.choice(["B", "C", "D"], 7)
+    chunks = []
+
+    def qz(z, exposure):
+        chunks.append((z, exposure))
+        return chapter26.velocity_pressure(z, exposure, 115, 0.85)
+
+    with ChunkedExecutor(workers=2, threshold=1000, chunk_size=1000) as executor:
+        result = executor(qz, z, exposure=exposure)
+    np.testing.assert_array_equal(result, chapter26.velocity_pressure(z, exposure, 115, 0.85))
+    assert len(chunks) > 1
+    for z_chunk, exposure_chunk in chunks:
+        assert np.shares_memory(z_chunk, z)
+        assert exposure_chunk is exposure
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from asce7 import tables
+from asce7.tables import parse_table, parse_tables
+
+_TEXT = """
+                value
+Label
+one             1.0     2.0
+two words       3.0     nan
+"""[1:-1]
+
+_FIGURE_TEXT = """
+x
+        1       10
+
+curve   y
+a       0.5     0.25
+        0.75    0.5
+b       1.0     0.5
+"""[1:-1]
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    monkeypatch.setattr(tables, "_MEMORY_CACHE", {})
+
+
+def test_parse_table(memory_cache):
+    table = parse_table(_TEXT)
+    assert table.header == (("value",), ("Label",))
+    assert table.labels == ("one", "two words")
+    np.testing.assert_array_equal(table.values, [[1.0, 2.0], [3.0, np.nan]])
+    assert not table.values.flags.writeable
+
+
+def test_parse_table_axes_and_continuation_rows(memory_cache):
+    table = parse_table(_FIGURE_TEXT)
+    assert table.header == (("x",), ("curve", "y"))
+    np.testing.assert_array_equal(table.axes[0], [1, 10])
+    assert table.labels == ("a", "a", "b")
+    np.testing.assert_array_equal(table.values, [[0.5, 0.25], [0.75, 0.5], [1.0, 0.5]])
+
+
+def test_parse_tables_blocks(memory_cache):
+    first, second = parse_tables("title\n\nA first\nrow  1  2\n\nA second\nrow  3\n")
+    assert first.header == (("title",), ("A first",))
+    assert second.header == (("A second",),)
+    np.testing.assert_array_equal(second.values, [[3]])
+
+
+def test_memory_cache(memory_cache, monkeypatch):
+    parsed = parse_tables(_FIGURE_TEXT)
+    monkeypatch.setattr(tables, "_parse", lambda text: pytest.fail("table string parsed again"))
+    assert parse_tables(_FIGURE_TEXT) is parsed
+
+
+def test_parse_table_expects_one_table(memory_cache):
+    with pytest.raises(ValueError):
+        parse_table("row  1\n\nrow  2\n")
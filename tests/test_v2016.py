@@ -1,3 +1,6 @@
+import subprocess
+import sys
+import pytest
 import asce7.v2016 as asce7
 
 
@@ -7,3 +10,30 @@ def test_Is(all_risk):
 
 def test_Ie(all_risk):
     assert asce7.I_e(all_risk)
+
+
+# seconds spent importing asce7.v2016 itself, once numpy is loaded
+IMPORT_TIME_BUDGET = 0.1
+
+
+def test_import_time():
+    code = ("import sys, time; import numpy; start = time.perf_counter(); import asce7.v2016; "
+            "print(time.perf_counter() - start); print(' '.join(sys.modules))")
+    elapsed, modules = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                      check=True).stdout.splitlines()
+    modules = modules.split()
+    for heavy in ("scipy", "numba", "ceng", "asce7.v2016.chapter2", "asce7.v2016.chapter7"):
+        assert heavy not in modules
+    assert float(elapsed) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_submodule():
+    from asce7.v2016 import chapter7
+    assert asce7.snow is chapter7
+    assert asce7.wind_other_structures is asce7.chapter29
+    assert "load_combinations" in dir(asce7)
+
+
+def test_lazy_submodule_missing():
+    with pytest.raises(AttributeError):
+        asce7.chapter99